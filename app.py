@@ -3,24 +3,83 @@ Flask Web Application for English to Kannada Translator
 Full-stack web application with REST API
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, send_from_directory, url_for, g
+from werkzeug.middleware.proxy_fix import ProxyFix
 import sys
 import os
+import functools
+import hashlib
+import hmac
+import math
+import mimetypes
+import re
+import time
+import uuid
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from translator import EnglishKannadaTranslator
+from text_templates import canonicalize
 from tts_engine import TTSEngine
 from speech_recognizer import SpeechRecognizer
+from transliterator import KannadaTransliterator
+from asset_pipeline import BUNDLES, DIST_DIR, load_manifest
+from structured_logging import get_logger, request_id_var
+from request_timing import RequestTimer, RequestProfiler, current_timer, timed
+from deadline import Deadline
+from scheduler import QueueFull, create_scheduler, parse_pairs
+from traffic_recorder import create_recorder
+from incremental import IncrementalTranslator
+
+logger = get_logger('app')
 
 app = Flask(__name__, template_folder='templates', static_folder='static')
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+# Number of reverse proxies in front of the app whose X-Forwarded-For is
+# trusted for the client address (0: use the connection's peer address)
+TRUSTED_PROXIES = int(os.environ.get('TRUSTED_PROXIES', 0))
+if TRUSTED_PROXIES:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXIES)
+
+# Named scheduler clients and their API keys ('client=key,...'). A request
+# presenting a key in X-API-Key is queued as that client (and gets its
+# SCHEDULER_CLIENT_WEIGHTS weight); everyone else by address
+CLIENT_KEYS = parse_pairs(os.environ.get('SCHEDULER_CLIENT_KEYS', ''))
+
+# Batch requests are split into chunks of this many texts, each queued as
+# one bulk job, so interactive requests can run between chunks
+BATCH_CHUNK_SIZE = int(os.environ.get('BATCH_CHUNK_SIZE', 16))
+
+# Most target languages accepted by one /api/translate-multi request
+MAX_FANOUT_TARGETS = int(os.environ.get('MAX_FANOUT_TARGETS', 12))
+
+# Cache-Control for GET /api/translate (seconds)
+TRANSLATE_CACHE_MAX_AGE = int(os.environ.get('TRANSLATE_CACHE_MAX_AGE', 86400))
+TRANSLATE_CACHE_SWR = int(os.environ.get('TRANSLATE_CACHE_SWR', 604800))
+
+# Request time budget (seconds): clients may ask for less or more via the
+# X-Request-Timeout header, up to the maximum
+REQUEST_DEADLINE = float(os.environ.get('TRANSLATE_DEADLINE', 10))
+REQUEST_DEADLINE_MAX = float(os.environ.get('TRANSLATE_DEADLINE_MAX', 30))
+
+# X-Request-ID values accepted from clients (anything else gets a new id)
+REQUEST_ID = re.compile(r'[A-Za-z0-9._-]{1,64}')
+
+# Fingerprinted assets are cached by browsers for a year
+ASSET_MAX_AGE = 365 * 24 * 3600
+
 # Initialize components
+profiler = RequestProfiler()
 translator = EnglishKannadaTranslator()
+scheduler = create_scheduler()
+recorder = create_recorder()
+incremental = IncrementalTranslator(translator)
 tts = TTSEngine()
+transliterator = KannadaTransliterator()
 
 # Configure TTS to not use GUI (only if engine initialized successfully)
 if tts and tts.engine:
@@ -28,7 +87,135 @@ if tts and tts.engine:
         tts.engine.setProperty('rate', 150)
         tts.engine.setProperty('volume', 0.9)
     except Exception as e:
-        print(f"Warning: Could not configure TTS properties: {e}")
+        logger.warning("Could not configure TTS properties: %s", e)
+
+
+def _gevent_active():
+    """Check whether we are running under a monkey-patched gevent worker"""
+    try:
+        from gevent import monkey
+        return monkey.is_module_patched('socket')
+    except ImportError:
+        return False
+
+
+def run_blocking(func, *args):
+    """
+    Run a call that blocks outside Python's socket layer (e.g. the TTS driver)
+    
+    Under the gevent worker such calls would stall every request served by the
+    process, so they are handed to gevent's native thread pool. Network calls
+    made through requests do not need this: they yield to other greenlets
+    while waiting on the upstream.
+    
+    Args:
+        func: Callable to run
+        *args: Positional arguments for func
+        
+    Returns:
+        The return value of func
+    """
+    if _gevent_active():
+        import gevent
+        return gevent.get_hub().threadpool.apply(func, args)
+    return func(*args)
+
+
+@app.before_request
+def start_request():
+    """Assign a request id (honouring X-Request-ID) and start the request timer"""
+    # Client ids end up in logs and profile file names, so only plain ones are kept
+    client_request_id = request.headers.get('X-Request-ID', '')
+    g.request_id = client_request_id if REQUEST_ID.fullmatch(client_request_id) else uuid.uuid4().hex
+    g.request_id_token = request_id_var.set(g.request_id)
+    g.start_time = time.perf_counter()
+    g.timer = RequestTimer()
+    g.timer_token = current_timer.set(g.timer)
+    g.profile = profiler.maybe_start()
+
+
+@app.after_request
+def finish_request(response):
+    """Echo the request id and log API calls"""
+    request_id = g.get('request_id')
+    if request_id:
+        response.headers['X-Request-ID'] = request_id
+    
+    profile = g.pop('profile', None)
+    if profile is not None:
+        profiler.finish(profile, request_id)
+    
+    timer = g.get('timer')
+    if timer is not None and request.path.startswith('/api/'):
+        response.headers['Server-Timing'] = timer.header()
+    
+    if request.path.startswith('/api/') and 'start_time' in g:
+        latency_ms = (time.perf_counter() - g.start_time) * 1000
+        logger.info("%s %s", request.method, request.path, extra={
+            'latency_ms': round(latency_ms, 1),
+            'outcome': response.status_code,
+        })
+        if recorder and recorder.sample():
+            recorder.record(request.method, request.path,
+                            request.query_string.decode('utf-8', 'replace'),
+                            request.get_data(as_text=True) if request.is_json else None,
+                            response.status_code, latency_ms)
+    return response
+
+
+@app.teardown_request
+def reset_request_id(error=None):
+    """Clear the request id and timer from the request context"""
+    token = g.pop('request_id_token', None)
+    if token is not None:
+        request_id_var.reset(token)
+    token = g.pop('timer_token', None)
+    if token is not None:
+        current_timer.reset(token)
+    profile = g.pop('profile', None)
+    if profile is not None:
+        profile.disable()
+
+
+asset_manifest = load_manifest()
+
+
+@app.context_processor
+def inject_asset_urls():
+    """Expose asset_urls() to templates"""
+    def asset_urls(bundle):
+        """
+        URLs to load for a bundle: the built, fingerprinted file if
+        `python build_assets.py` has been run, else the unbundled sources
+        """
+        if asset_manifest and bundle in asset_manifest:
+            return [url_for('serve_asset', filename=asset_manifest[bundle])]
+        return [url_for('static', filename=source) for source in BUNDLES[bundle]]
+    return {'asset_urls': asset_urls}
+
+
+@app.route('/assets/<path:filename>')
+def serve_asset(filename):
+    """Serve a built asset, precompressed when the client accepts it"""
+    mimetype = mimetypes.guess_type(filename)[0]
+    encoding = None
+    
+    for candidate, suffix in (('br', '.br'), ('gzip', '.gz')):
+        if request.accept_encodings[candidate] and \
+                os.path.isfile(os.path.join(DIST_DIR, filename + suffix)):
+            encoding = candidate
+            filename += suffix
+            break
+    
+    response = send_from_directory(DIST_DIR, filename, mimetype=mimetype,
+                                   max_age=ASSET_MAX_AGE)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+        response.headers.pop('Content-Disposition', None)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
 
 
 @app.route('/')
@@ -50,52 +237,405 @@ def api_translate():
     Expected JSON: {"text": "English text to translate"}
     """
     try:
-        data = request.get_json()
-        english_text = data.get('text', '').strip()
+        deadline = request_deadline()
+        with timed('parse'):
+            data = request.get_json()
+            english_text = data.get('text', '').strip()
         
         if not english_text:
             return jsonify({'error': 'No text provided'}), 400
         
         # Translate the text
-        kannada_text = translator.translate(english_text)
+        with timed('translate'):
+            kannada_text, stale = schedule('interactive', translator.translate_with_status,
+                                           english_text, deadline,
+                                           deadline=deadline) or (None, False)
         
         if kannada_text:
-            return jsonify({
-                'success': True,
-                'english': english_text,
-                'kannada': kannada_text,
-                'timestamp': datetime.now().isoformat()
-            })
+            with timed('serialize'):
+                return jsonify({
+                    'success': True,
+                    'english': english_text,
+                    'kannada': kannada_text,
+                    'stale': stale,
+                    'timestamp': datetime.now().isoformat()
+                })
         else:
-            return jsonify({'error': 'Translation failed'}), 500
+            return translation_failed(deadline)
     
+    except QueueFull as e:
+        return overloaded(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def request_deadline():
+    """
+    Deadline for the current request
+    
+    Uses the X-Request-Timeout header (seconds) if present and a finite
+    number, clamped to TRANSLATE_DEADLINE_MAX, else the server default.
+    """
+    seconds = REQUEST_DEADLINE
+    header = request.headers.get('X-Request-Timeout')
+    if header:
+        try:
+            value = float(header)
+        except ValueError:
+            value = math.nan
+        if math.isfinite(value):
+            seconds = value
+    return Deadline(max(0.0, min(seconds, REQUEST_DEADLINE_MAX)))
+
+
+def translation_failed(deadline):
+    """Error response for a failed translation (504 if the budget ran out)"""
+    if deadline.expired():
+        return jsonify({'error': 'Translation timed out'}), 504
+    return jsonify({'error': 'Translation failed'}), 500
+
+
+def client_id():
+    """
+    Client identity used for fair queuing
+    
+    Only identities the server can verify are used, since clients could
+    otherwise pick a fresh one per request or claim a weighted partner's:
+    the client named by a valid X-API-Key, else the remote address.
+    """
+    key = request.headers.get('X-API-Key')
+    if key:
+        for client, client_key in CLIENT_KEYS.items():
+            if hmac.compare_digest(key.encode('utf-8'), client_key.encode('utf-8')):
+                return client
+    return request.remote_addr or 'unknown'
+
+
+def schedule(priority, func, *args, deadline, cost=1):
+    """
+    Run a call through the scheduler and wait for it within the deadline
+    
+    Args:
+        priority: 'interactive' or 'bulk'
+        func: Callable to run
+        *args: Positional arguments for func
+        deadline: Request deadline; the call is dropped if still queued when it passes
+        cost: Relative cost used for fair queuing
+        
+    Returns:
+        The call's return value, or None if the deadline passed first
+        
+    Raises:
+        QueueFull: If the priority class's queue is full
+    """
+    future = scheduler.submit(priority, client_id(), profiled(func), *args, cost=cost)
+    return wait_for(future, deadline)
+
+
+def profiled(func):
+    """
+    Wrap a call so a sampled request's profile follows it onto a scheduler worker
+    
+    cProfile only sees the thread that enabled it, and translation runs on
+    scheduler threads, so the profile is moved to the first scheduled call
+    of the request (it is disabled on the request thread from then on).
+    """
+    profile = g.get('profile')
+    if profile is None or g.get('profile_moved'):
+        return func
+    g.profile_moved = True
+    profile.disable()
+    return functools.partial(profiler.run, profile, func)
+
+
+def wait_for(future, deadline):
+    """Result of a scheduled call, or None (and the call cancelled) once the deadline passes"""
+    try:
+        return future.result(timeout=max(0.0, deadline.remaining()))
+    except FutureTimeoutError:
+        future.cancel()
+        return None
+
+
+def overloaded(error):
+    """503 response for work shed by the scheduler"""
+    response = jsonify({'error': 'Server busy, please retry', 'retry_after': error.retry_after})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(error.retry_after)
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+@app.route('/api/translate', methods=['GET'])
+def api_translate_get():
+    """
+    Cacheable API endpoint for text translation
+    Expected query: /api/translate?text=English+text+to+translate
+    
+    Responses carry a strong ETag and Cache-Control so browsers and reverse
+    proxies can serve repeats; If-None-Match is answered with 304.
+    """
+    deadline = request_deadline()
+    with timed('parse'):
+        # Same normalization as the translator's cache keys (line breaks kept)
+        english_text = canonicalize(request.args.get('text', ''))
+    
+    if not english_text:
+        response = jsonify({'error': 'No text provided'})
+        response.status_code = 400
+        response.headers['Cache-Control'] = 'no-store'
+        return response
+    
+    with timed('translate'):
+        try:
+            kannada_text, stale = schedule('interactive', translator.translate_with_status,
+                                           english_text, deadline,
+                                           deadline=deadline) or (None, False)
+        except QueueFull as e:
+            return overloaded(e)
+    
+    if not kannada_text:
+        body, status = translation_failed(deadline)
+        body.status_code = status
+        body.headers['Cache-Control'] = 'no-store'
+        return body
+    
+    # No timestamp: the body must be byte-identical for a strong ETag
+    with timed('serialize'):
+        response = jsonify({
+            'success': True,
+            'english': english_text,
+            'kannada': kannada_text,
+            'stale': stale
+        })
+        response.set_etag(hashlib.sha256(response.get_data()).hexdigest())
+    if stale:
+        # Being refreshed in the background: clients should ask again soon
+        response.headers['Cache-Control'] = 'no-cache'
+    else:
+        response.headers['Cache-Control'] = (
+            f'public, max-age={TRANSLATE_CACHE_MAX_AGE}, '
+            f'stale-while-revalidate={TRANSLATE_CACHE_SWR}'
+        )
+    response.vary.add('Accept-Encoding')
+    return response.make_conditional(request)
+
+
 @app.route('/api/translate-batch', methods=['POST'])
 def api_translate_batch():
     """
     API endpoint for batch translation
     Expected JSON: {"texts": ["text1", "text2", ...]}
     """
+    try:
+        deadline = request_deadline()
+        with timed('parse'):
+            data = request.get_json()
+            texts = data.get('texts', [])
+        
+        if not texts or not isinstance(texts, list):
+            return jsonify({'error': 'No texts provided or invalid format'}), 400
+        
+        # Queue the texts as bulk chunks; each chunk runs on one scheduler
+        # worker, so batches never take more than their share of the backends
+        chunks = [texts[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(texts), BATCH_CHUNK_SIZE)]
+        max_texts = scheduler.capacity('bulk') * BATCH_CHUNK_SIZE
+        if len(texts) > max_texts:
+            # Would never fit in the queue, so a retry cannot help
+            return jsonify({'error': f'Too many texts (at most {max_texts} per request)',
+                            'max_texts': max_texts}), 413
+        
+        with timed('translate'):
+            futures = scheduler.submit_all(
+                'bulk', client_id(),
+                [(profiled(translator.translate_batch_with_status), chunk, 1, deadline)
+                 for chunk in chunks],
+                [len(chunk) for chunk in chunks]
+            )
+            results, stale = [], []
+            for chunk, future in zip(chunks, futures):
+                chunk_results, chunk_stale = (wait_for(future, deadline)
+                                              or ([None] * len(chunk), [False] * len(chunk)))
+                results.extend(chunk_results)
+                stale.extend(chunk_stale)
+        
+        with timed('serialize'):
+            return jsonify({
+                'success': True,
+                'translations': [
+                    {'english': eng, 'kannada': kan, 'stale': is_stale}
+                    for eng, kan, is_stale in zip(texts, results, stale)
+                ],
+                'timestamp': datetime.now().isoformat()
+            })
+    
+    except QueueFull as e:
+        return overloaded(e)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/translate-incremental', methods=['POST'])
+def api_translate_incremental():
+    """
+    API endpoint re-translating only the sentences edited since the last call
+    Expected JSON: {"text": "Full English text", "document_id": "id from the previous response"}
+    """
+    try:
+        deadline = request_deadline()
+        with timed('parse'):
+            data = request.get_json()
+            english_text = data.get('text', '').strip()
+            document_id = data.get('document_id') or None
+        
+        if not english_text:
+            return jsonify({'error': 'No text provided'}), 400
+        
+        # Cost is the number of sentences to translate, and revisions with
+        # more than a batch chunk of them (e.g. a long first revision) are
+        # queued as bulk work, like /api/translate-batch
+        changed = incremental.changed_count(english_text, document_id)
+        priority = 'bulk' if changed > BATCH_CHUNK_SIZE else 'interactive'
+        with timed('translate'):
+            result = schedule(priority, incremental.translate, english_text, document_id, deadline,
+                              deadline=deadline, cost=max(1, changed))
+        
+        if not result or not result['translation']:
+            return translation_failed(deadline)
+        
+        with timed('serialize'):
+            return jsonify({
+                'success': True,
+                'english': english_text,
+                'kannada': result['translation'],
+                'document_id': result['document_id'],
+                'sentences': result['sentences'],
+                'translated': result['translated'],
+                'reused': result['reused'],
+                'stale': result['stale'],
+                'timestamp': datetime.now().isoformat()
+            })
+    
+    except QueueFull as e:
+        return overloaded(e)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/translate-multi', methods=['POST'])
+def api_translate_multi():
+    """
+    API endpoint translating one text into several languages at once
+    Expected JSON: {"text": "English text", "targets": ["kn", "hi", "ta"],
+                    "source": "en" (optional)}
+    """
+    try:
+        deadline = request_deadline()
+        with timed('parse'):
+            data = request.get_json()
+            text = data.get('text', '').strip()
+            targets = data.get('targets', [])
+            source = data.get('source')
+        
+        if not text:
+            return jsonify({'error': 'No text provided'}), 400
+        
+        if not targets or not isinstance(targets, list):
+            return jsonify({'error': 'No targets provided or invalid format'}), 400
+        
+        if len(targets) > MAX_FANOUT_TARGETS:
+            return jsonify({'error': f'At most {MAX_FANOUT_TARGETS} targets per request'}), 400
+        
+        with timed('translate'):
+            try:
+                results = schedule('interactive', translator.translate_multi_with_status,
+                                   text, targets, deadline, source,
+                                   deadline=deadline, cost=len(targets)) or {}
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+        
+        translations = {target: result for target, (result, _) in results.items()}
+        if not any(translations.values()):
+            return translation_failed(deadline)
+        
+        with timed('serialize'):
+            return jsonify({
+                'success': True,
+                'text': text,
+                'source': source or translator.source_lang,
+                'translations': translations,
+                'failed': [target for target, result in translations.items() if not result],
+                'stale': [target for target, (_, stale) in results.items() if stale],
+                'timestamp': datetime.now().isoformat()
+            })
+    
+    except QueueFull as e:
+        return overloaded(e)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/transliterate', methods=['POST'])
+def api_transliterate():
+    """
+    API endpoint for offline transliteration
+    Expected JSON: {"text": "...", "direction": "to_latin" or "to_kannada",
+                    "scheme": "iso" or "itrans"}
+    """
+    try:
+        data = request.get_json()
+        text = data.get('text', '')
+        direction = data.get('direction', 'to_latin')
+        scheme = data.get('scheme', 'iso')
+        
+        if not text.strip():
+            return jsonify({'error': 'No text provided'}), 400
+        
+        try:
+            result = transliterator.transliterate(text, direction, scheme)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        return jsonify({
+            'success': True,
+            'text': text,
+            'result': result,
+            'direction': direction,
+            'scheme': scheme
+        })
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/transliterate-batch', methods=['POST'])
+def api_transliterate_batch():
+    """
+    API endpoint for batch transliteration
+    Expected JSON: {"texts": ["text1", ...], "direction": ..., "scheme": ...}
+    """
     try:
         data = request.get_json()
         texts = data.get('texts', [])
+        direction = data.get('direction', 'to_latin')
+        scheme = data.get('scheme', 'iso')
         
         if not texts or not isinstance(texts, list):
             return jsonify({'error': 'No texts provided or invalid format'}), 400
         
-        # Translate all texts
-        results = translator.translate_batch(texts)
+        try:
+            results = transliterator.transliterate_batch(texts, direction, scheme)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
         return jsonify({
             'success': True,
-            'translations': [
-                {'english': eng, 'kannada': kan}
-                for eng, kan in zip(texts, results)
+            'results': [
+                {'text': text, 'result': result}
+                for text, result in zip(texts, results)
             ],
-            'timestamp': datetime.now().isoformat()
+            'direction': direction,
+            'scheme': scheme
         })
     
     except Exception as e:
@@ -123,7 +663,7 @@ def api_speak():
         # For now, we'll just confirm receipt
         try:
             # Try to speak (may not work in headless environment)
-            tts.speak(text, language)
+            run_blocking(tts.speak, text, language)
         except:
             pass  # Silently fail for headless environments
         
@@ -145,6 +685,11 @@ def health_check():
         'status': 'healthy',
         'service': 'English to Kannada Translator API',
         'version': '1.0.0',
+        'cache': translator.cache.stats(),
+        'negative_cache': translator.failures.stats(),
+        'cache_refresh': translator.refresh_status(),
+        'backends': translator.dispatcher.stats(),
+        'scheduler': scheduler.stats(),
         'timestamp': datetime.now().isoformat()
     })
 
@@ -162,11 +707,40 @@ def api_info():
                 'path': '/api/translate',
                 'params': {'text': 'English text to translate'}
             },
+            'translate_get': {
+                'method': 'GET',
+                'path': '/api/translate?text=...',
+                'params': {'text': 'English text to translate (cacheable, supports ETag)'}
+            },
             'translate_batch': {
                 'method': 'POST',
                 'path': '/api/translate-batch',
                 'params': {'texts': 'Array of English texts'}
             },
+            'translate_incremental': {
+                'method': 'POST',
+                'path': '/api/translate-incremental',
+                'params': {'text': 'Full English text',
+                           'document_id': 'Id returned by the previous call (optional)'}
+            },
+            'translate_multi': {
+                'method': 'POST',
+                'path': '/api/translate-multi',
+                'params': {'text': 'Text to translate', 'targets': 'Array of language codes',
+                           'source': 'Source language code (optional)'}
+            },
+            'transliterate': {
+                'method': 'POST',
+                'path': '/api/transliterate',
+                'params': {'text': 'Text to convert', 'direction': 'to_latin or to_kannada',
+                           'scheme': 'iso or itrans'}
+            },
+            'transliterate_batch': {
+                'method': 'POST',
+                'path': '/api/transliterate-batch',
+                'params': {'texts': 'Array of texts', 'direction': 'to_latin or to_kannada',
+                           'scheme': 'iso or itrans'}
+            },
             'speak': {
                 'method': 'POST',
                 'path': '/api/speak',
@@ -0,0 +1,14 @@
+"""
+English to Kannada Translator - Static Asset Build Entry Point
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from asset_pipeline import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+"""
+English to Kannada Translator - Bulk File Translation Entry Point
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from bulk_translator import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,20 @@
+"""
+Gunicorn configuration for the English to Kannada Translator
+Selects between the default sync workers and the async (gevent) serving mode
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# 'sync' (default) or 'gevent' for the async serving mode. With gevent each
+# request runs in a greenlet and yields while waiting on the translation
+# upstream, so one worker can hold hundreds of slow requests at once.
+worker_class = os.environ.get('WORKER_CLASS', 'sync')
+
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+
+# Maximum simultaneous requests per worker (gevent only)
+worker_connections = int(os.environ.get('WORKER_CONNECTIONS', 1000))
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
@@ -0,0 +1,206 @@
+"""
+Static Asset Pipeline
+Bundles, minifies, fingerprints and precompresses the web UI's CSS and JS
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from typing import Dict, List, Optional
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+
+STATIC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'static'))
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+MANIFEST_NAME = 'manifest.json'
+
+# Bundle name -> source files (relative to static/), in load order
+BUNDLES = {
+    'landing.css': ['css/landing.css'],
+    'landing.js': ['js/landing.js'],
+    'app.css': ['css/style.css'],
+    'app.js': ['js/cache.js', 'js/api.js', 'js/app.js'],
+}
+
+# Characters after which a '/' starts a regex literal rather than a division
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+
+
+def minify_css(source: str) -> str:
+    """
+    Minify CSS by removing comments and redundant whitespace
+
+    Args:
+        source: CSS text
+
+    Returns:
+        Minified CSS
+    """
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};,>])\s*', r'\1', source)
+    source = re.sub(r':\s+', ':', source)
+    source = source.replace(';}', '}')
+    return source.strip()
+
+
+def minify_js(source: str) -> str:
+    """
+    Minify JavaScript conservatively
+
+    Comments, indentation and blank lines are removed. Line breaks are kept so
+    automatic semicolon insertion behaves exactly as in the source. String,
+    template and regex literals are copied through untouched.
+
+    Args:
+        source: JavaScript text
+
+    Returns:
+        Minified JavaScript
+    """
+    out = []
+    i = 0
+    length = len(source)
+    last_significant = ''
+
+    while i < length:
+        char = source[i]
+        pair = source[i:i + 2]
+
+        if pair == '//':
+            end = source.find('\n', i)
+            i = length if end == -1 else end
+            continue
+
+        if pair == '/*':
+            end = source.find('*/', i + 2)
+            i = length if end == -1 else end + 2
+            continue
+
+        if char in '\'"`' or (char == '/' and (not last_significant or last_significant in _REGEX_PRECEDERS)):
+            start = i
+            i += 1
+            in_class = False
+            while i < length:
+                if source[i] == '\\':
+                    i += 2
+                    continue
+                if char == '/':
+                    if source[i] == '[':
+                        in_class = True
+                    elif source[i] == ']':
+                        in_class = False
+                    elif source[i] == '/' and not in_class:
+                        break
+                elif source[i] == char:
+                    break
+                i += 1
+            i += 1
+            out.append(source[start:i])
+            last_significant = char
+            continue
+
+        out.append(char)
+        if not char.isspace():
+            last_significant = char
+        i += 1
+
+    lines = (line.strip() for line in ''.join(out).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _write_compressed(path: str, data: bytes):
+    """Write gzip (and brotli, if available) variants next to a file"""
+    with open(path + '.gz', 'wb') as handle:
+        handle.write(gzip.compress(data, compresslevel=9, mtime=0))
+    if BROTLI_AVAILABLE:
+        with open(path + '.br', 'wb') as handle:
+            handle.write(brotli.compress(data, quality=11))
+
+
+def build_assets(static_dir: str = STATIC_DIR, dist_dir: str = DIST_DIR) -> Dict[str, str]:
+    """
+    Build every bundle into the dist directory
+
+    Args:
+        static_dir: Directory holding the source assets
+        dist_dir: Output directory (recreated on every build)
+
+    Returns:
+        Manifest mapping bundle names to fingerprinted file names
+    """
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+    os.makedirs(dist_dir)
+
+    manifest = {}
+    for name, sources in BUNDLES.items():
+        parts = []
+        for source in sources:
+            with open(os.path.join(static_dir, source), 'r', encoding='utf-8') as handle:
+                parts.append(handle.read())
+
+        base, extension = os.path.splitext(name)
+        if extension == '.css':
+            content = minify_css('\n'.join(parts))
+        else:
+            content = '\n;\n'.join(minify_js(part) for part in parts)
+
+        data = content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        filename = f"{base}.{digest}{extension}"
+
+        path = os.path.join(dist_dir, filename)
+        with open(path, 'wb') as handle:
+            handle.write(data)
+        _write_compressed(path, data)
+        manifest[name] = filename
+
+    with open(os.path.join(dist_dir, MANIFEST_NAME), 'w', encoding='utf-8') as handle:
+        json.dump(manifest, handle, indent=2)
+
+    return manifest
+
+
+def load_manifest(dist_dir: str = DIST_DIR) -> Optional[Dict[str, str]]:
+    """
+    Load the manifest written by build_assets
+
+    Returns:
+        Manifest dict, or None if the assets have not been built
+    """
+    try:
+        with open(os.path.join(dist_dir, MANIFEST_NAME), 'r', encoding='utf-8') as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Build fingerprinted static assets")
+    parser.add_argument('--static-dir', default=STATIC_DIR, help="Source asset directory")
+    parser.add_argument('--dist-dir', default=DIST_DIR, help="Output directory")
+    args = parser.parse_args(argv)
+
+    manifest = build_assets(args.static_dir, args.dist_dir)
+    for name, filename in manifest.items():
+        size = os.path.getsize(os.path.join(args.dist_dir, filename))
+        print(f"{name:<12} -> {filename} ({size} bytes)")
+    if not BROTLI_AVAILABLE:
+        print("Note: brotli not installed, only gzip variants were written")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
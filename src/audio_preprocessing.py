@@ -0,0 +1,177 @@
+"""
+Audio Preprocessing Module
+In-memory NumPy pipeline that shrinks recordings before speech recognition
+"""
+
+import io
+import os
+import wave
+from typing import Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+# Google speech recognition works at 16 kHz; higher rates only add upload size
+TARGET_RATE = int(os.getenv('AUDIO_TARGET_RATE', 16000))
+
+# Frames quieter than this relative to the loudest frame count as silence (dB)
+SILENCE_DB = float(os.getenv('AUDIO_SILENCE_DB', -40))
+
+# Silence kept around the speech so word edges are not clipped (ms)
+SILENCE_PAD_MS = 200
+
+# Energy frame length for silence detection (ms)
+FRAME_MS = 20
+
+# Peak level after normalization (fraction of full scale) and the most gain applied
+TARGET_PEAK = 0.9
+MAX_GAIN = 10.0  # 20 dB; more would mostly amplify noise
+
+
+def decode_pcm(data: bytes, sample_width: int, channels: int = 1,
+               unsigned_8bit: bool = True) -> "np.ndarray":
+    """
+    Convert little-endian PCM bytes to float32 samples in [-1, 1]
+
+    Args:
+        data: Raw PCM frames
+        sample_width: Bytes per sample (1, 2, 3 or 4)
+        channels: Interleaved channel count
+        unsigned_8bit: Whether 8-bit samples are unsigned (as in WAV files)
+            rather than signed (as in speech_recognition's AudioData)
+
+    Returns:
+        Array of shape (frames, channels)
+    """
+    if sample_width == 1 and unsigned_8bit:
+        samples = (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif sample_width == 1:
+        samples = np.frombuffer(data, dtype=np.int8).astype(np.float32) / 128
+    elif sample_width == 3:
+        raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        ints = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        ints = np.where(ints & 0x800000, ints - 0x1000000, ints)
+        samples = ints.astype(np.float32) / 0x800000
+    elif sample_width in (2, 4):
+        dtype = np.int16 if sample_width == 2 else np.int32
+        samples = np.frombuffer(data, dtype=f"<{np.dtype(dtype).char}").astype(np.float32)
+        samples /= float(np.iinfo(dtype).max) + 1
+    else:
+        raise ValueError(f"Unsupported sample width: {sample_width} bytes")
+
+    frames = len(samples) // channels
+    return samples[:frames * channels].reshape(frames, channels)
+
+
+def read_wav(data: bytes) -> Tuple["np.ndarray", int]:
+    """
+    Decode a PCM WAV file held in memory
+
+    Returns:
+        (samples of shape (frames, channels), sample rate)
+
+    Raises:
+        ValueError: If the data is not PCM WAV
+    """
+    try:
+        with wave.open(io.BytesIO(data), 'rb') as reader:
+            pcm = reader.readframes(reader.getnframes())
+            return decode_pcm(pcm, reader.getsampwidth(), reader.getnchannels()), reader.getframerate()
+    except (wave.Error, EOFError) as e:
+        raise ValueError(f"Not a PCM WAV file: {e}")
+
+
+def downmix(samples: "np.ndarray") -> "np.ndarray":
+    """Average all channels into one"""
+    return samples.mean(axis=1) if samples.ndim == 2 else samples
+
+
+def resample(samples: "np.ndarray", rate: int, target: int = TARGET_RATE) -> "np.ndarray":
+    """
+    Resample mono audio down to the target rate
+
+    Low-pass filters first (windowed-sinc FIR) so content above the new
+    Nyquist frequency does not alias, then interpolates linearly. Audio at
+    or below the target rate is returned unchanged: upsampling would only
+    make it bigger.
+
+    Args:
+        samples: Mono samples
+        rate: Current sample rate
+        target: New sample rate
+
+    Returns:
+        Resampled samples
+    """
+    if rate <= target or len(samples) < 2:
+        return samples
+
+    taps = 63
+    cutoff = 0.45 * target / rate  # Cycles per input sample, just under the new Nyquist
+    n = np.arange(taps) - (taps - 1) / 2
+    kernel = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(taps)
+    samples = np.convolve(samples, (kernel / kernel.sum()).astype(np.float32), mode='same')
+
+    duration = len(samples) / rate
+    positions = np.arange(int(duration * target)) * (rate / target)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def normalize_gain(samples: "np.ndarray") -> "np.ndarray":
+    """Scale so the peak reaches TARGET_PEAK, boosting by at most MAX_GAIN"""
+    peak = float(np.max(np.abs(samples))) if len(samples) else 0.0
+    if peak == 0:
+        return samples
+    return samples * min(TARGET_PEAK / peak, MAX_GAIN)
+
+
+def trim_silence(samples: "np.ndarray", rate: int, threshold_db: float = SILENCE_DB) -> "np.ndarray":
+    """
+    Cut leading and trailing silence (pauses inside the speech are kept)
+
+    Args:
+        samples: Mono samples
+        rate: Sample rate
+        threshold_db: Frame level, relative to the loudest frame, below
+            which a frame is silent
+
+    Returns:
+        The speech span plus SILENCE_PAD_MS on either side, or the input
+        unchanged if no frame is above the threshold
+    """
+    frame = max(1, rate * FRAME_MS // 1000)
+    count = len(samples) // frame
+    if count == 0:
+        return samples
+
+    energy = np.sqrt(np.mean(samples[:count * frame].reshape(count, frame) ** 2, axis=1))
+    voiced = np.flatnonzero(energy > energy.max() * 10 ** (threshold_db / 20))
+    if len(voiced) == 0:
+        return samples
+
+    pad = rate * SILENCE_PAD_MS // 1000
+    start = max(0, voiced[0] * frame - pad)
+    end = min(len(samples), (voiced[-1] + 1) * frame + pad)
+    return samples[start:end]
+
+
+def preprocess(samples: "np.ndarray", rate: int, target: int = TARGET_RATE) -> Tuple[bytes, int]:
+    """
+    Downmix, downsample, normalize and trim audio for speech recognition
+
+    Args:
+        samples: Float samples of shape (frames, channels) or (frames,)
+        rate: Sample rate of samples
+        target: Highest output sample rate
+
+    Returns:
+        (16-bit mono PCM, its sample rate: the target, or the input rate if lower)
+    """
+    rate_out = min(rate, target)
+    mono = resample(downmix(samples).astype(np.float32), rate, target)
+    mono = trim_silence(normalize_gain(mono), rate_out)
+    return (np.clip(mono, -1.0, 1.0) * 32767).astype('<i2').tobytes(), rate_out
@@ -0,0 +1,347 @@
+"""
+Bulk File Translation Module
+Streams large text, CSV, JSONL and SRT files through the translator
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from translator import EnglishKannadaTranslator
+
+
+SUPPORTED_FORMATS = ('text', 'csv', 'jsonl', 'srt')
+
+EXTENSION_FORMATS = {
+    '.txt': 'text',
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.srt': 'srt',
+}
+
+# A record is the list of strings to translate plus a function that renders
+# the output chunk for that record from the translated strings.
+Record = Tuple[List[str], Callable[[List[str]], str]]
+
+
+def detect_format(path: str) -> str:
+    """
+    Guess the file format from its extension
+
+    Args:
+        path: Input file path
+
+    Returns:
+        One of SUPPORTED_FORMATS (defaults to 'text')
+    """
+    extension = os.path.splitext(path)[1].lower()
+    return EXTENSION_FORMATS.get(extension, 'text')
+
+
+def iter_text_records(handle) -> Iterator[Record]:
+    """Yield one record per line of a plain text file"""
+    for line in handle:
+        content = line.rstrip('\r\n')
+        ending = line[len(content):]
+        if not content.strip():
+            yield [], lambda _, line=line: line
+            continue
+        yield [content], lambda out, ending=ending: out[0] + ending
+
+
+def iter_csv_records(handle, fields: List[str]) -> Iterator[Record]:
+    """
+    Yield one record per CSV row, translating only the given columns
+
+    The header row is emitted unchanged as the first record.
+
+    Args:
+        handle: Open input file
+        fields: Column names to translate
+
+    Raises:
+        ValueError: If a requested column is not in the header
+    """
+    reader = csv.reader(handle)
+    columns = next(reader, None)
+    if columns is None:
+        return
+
+    missing = [field for field in fields if field not in columns]
+    if missing:
+        raise ValueError(f"CSV columns not found: {', '.join(missing)}")
+    indexes = [columns.index(field) for field in fields]
+
+    def render_row(row):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(row)
+        return buffer.getvalue()
+
+    yield [], lambda _: render_row(columns)
+
+    for row in reader:
+        targets = [i for i in indexes if i < len(row) and row[i].strip()]
+
+        def render(out, row=row, targets=targets):
+            row = list(row)
+            for i, value in zip(targets, out):
+                row[i] = value
+            return render_row(row)
+
+        yield [row[i] for i in targets], render
+
+
+def iter_jsonl_records(handle, fields: List[str]) -> Iterator[Record]:
+    """
+    Yield one record per JSON line, translating only the given string fields
+
+    Lines that are not JSON objects (arrays, strings, numbers) have no
+    fields to translate and are written back unchanged.
+
+    Args:
+        handle: Open input file
+        fields: Top-level keys to translate
+    """
+    for line in handle:
+        if not line.strip():
+            continue
+        obj = json.loads(line)
+        targets = [
+            field for field in fields
+            if isinstance(obj.get(field), str) and obj[field].strip()
+        ] if isinstance(obj, dict) else []
+
+        def render(out, obj=obj, targets=targets):
+            for field, value in zip(targets, out):
+                obj[field] = value
+            return json.dumps(obj, ensure_ascii=False) + '\n'
+
+        yield [obj[field] for field in targets], render
+
+
+def iter_srt_records(handle) -> Iterator[Record]:
+    """
+    Yield one record per subtitle cue, keeping the index and timing lines
+
+    Each text line of a cue is translated separately so that the original
+    line breaks are preserved.
+    """
+    block = []
+    for line in handle:
+        line = line.rstrip('\r\n')
+        if line.strip():
+            block.append(line)
+            continue
+        if block:
+            yield _srt_record(block)
+            block = []
+    if block:
+        yield _srt_record(block)
+
+
+def _srt_record(block: List[str]) -> Record:
+    """Build a record from the lines of a single SRT cue"""
+    timing_index = next((i for i, line in enumerate(block) if '-->' in line), None)
+    if timing_index is None:
+        return [], lambda _: '\n'.join(block) + '\n\n'
+
+    head = block[:timing_index + 1]
+    lines = block[timing_index + 1:]
+
+    def render(out):
+        return '\n'.join(head + out) + '\n\n'
+
+    return lines, render
+
+
+class BulkTranslator:
+    """Streams files through the translator with bounded concurrency"""
+
+    def __init__(self, translator: Optional[EnglishKannadaTranslator] = None,
+                 concurrency: int = 4, checkpoint_every: int = 500):
+        """
+        Initialize the bulk translator
+
+        Args:
+            translator: Translator instance (created if not given)
+            concurrency: Maximum number of records translated at once
+            checkpoint_every: Number of records between checkpoints
+        """
+        self.translator = translator or EnglishKannadaTranslator()
+        self.concurrency = max(1, concurrency)
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def _translate_record(self, texts: List[str]) -> List[str]:
+        """Translate every string in a record, keeping the original on failure"""
+        results = []
+        for text in texts:
+            translated = self.translator.translate(text)
+            if not translated:
+                with self._lock:
+                    self.failures += 1
+                translated = text
+            results.append(translated)
+        return results
+
+    def _ordered_map(self, records: Iterator[Record]) -> Iterator[str]:
+        """
+        Translate records concurrently and yield rendered output in input order
+
+        At most ``2 * concurrency`` records are held in memory at a time.
+        """
+        window = deque()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for texts, render in records:
+                window.append((render, pool.submit(self._translate_record, texts)))
+                if len(window) >= self.concurrency * 2:
+                    render, future = window.popleft()
+                    yield render(future.result())
+            while window:
+                render, future = window.popleft()
+                yield render(future.result())
+
+    def _open_records(self, handle, fmt: str, fields: List[str]):
+        """Create the record generator for a format"""
+        if fmt == 'text':
+            return iter_text_records(handle)
+        if fmt == 'csv':
+            return iter_csv_records(handle, fields)
+        if fmt == 'jsonl':
+            return iter_jsonl_records(handle, fields)
+        if fmt == 'srt':
+            return iter_srt_records(handle)
+        raise ValueError(f"Unsupported format: {fmt}")
+
+    @staticmethod
+    def checkpoint_path(output_path: str) -> str:
+        """Path of the checkpoint file kept next to the output"""
+        return output_path + '.checkpoint'
+
+    def _load_checkpoint(self, input_path: str, output_path: str) -> Tuple[int, int]:
+        """
+        Load a checkpoint for this job
+
+        Returns:
+            Tuple of (records already written, output byte offset)
+        """
+        path = self.checkpoint_path(output_path)
+        if not os.path.exists(path) or not os.path.exists(output_path):
+            return 0, 0
+        with open(path, 'r', encoding='utf-8') as handle:
+            state = json.load(handle)
+        if state.get('input') != os.path.abspath(input_path):
+            raise ValueError(f"Checkpoint {path} belongs to a different input file")
+        return state.get('records', 0), state.get('offset', 0)
+
+    def _save_checkpoint(self, input_path: str, output_path: str,
+                         fmt: str, records: int, offset: int):
+        """Atomically write the checkpoint for this job"""
+        path = self.checkpoint_path(output_path)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            json.dump({
+                'input': os.path.abspath(input_path),
+                'format': fmt,
+                'records': records,
+                'offset': offset,
+            }, handle)
+        os.replace(temp_path, path)
+
+    def translate_file(self, input_path: str, output_path: str,
+                       fmt: Optional[str] = None, fields: Optional[List[str]] = None,
+                       resume: bool = False) -> int:
+        """
+        Translate a file, writing the output incrementally
+
+        Args:
+            input_path: File to translate
+            output_path: File to write
+            fmt: One of SUPPORTED_FORMATS (detected from the extension if None)
+            fields: CSV columns or JSONL keys to translate (default: ['text'])
+            resume: Continue from the last checkpoint if one exists
+
+        Returns:
+            Number of records written
+        """
+        fmt = fmt or detect_format(input_path)
+        if fmt not in SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}")
+        fields = fields or ['text']
+
+        done, offset = (0, 0)
+        if resume:
+            done, offset = self._load_checkpoint(input_path, output_path)
+
+        mode = 'r+' if done else 'w'
+        written = done
+        with open(input_path, 'r', encoding='utf-8-sig', newline='') as source, \
+                open(output_path, mode, encoding='utf-8', newline='') as sink:
+            if done:
+                sink.seek(offset)
+                sink.truncate()
+
+            records = self._open_records(source, fmt, fields)
+            for _ in range(done):
+                if next(records, None) is None:
+                    break
+
+            for chunk in self._ordered_map(records):
+                sink.write(chunk)
+                written += 1
+                if written % self.checkpoint_every == 0:
+                    sink.flush()
+                    self._save_checkpoint(input_path, output_path, fmt,
+                                          written, sink.tell())
+
+        checkpoint = self.checkpoint_path(output_path)
+        if os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        return written
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        description="Translate large text, CSV, JSONL or SRT files from English to Kannada"
+    )
+    parser.add_argument('input', help="Input file")
+    parser.add_argument('output', help="Output file")
+    parser.add_argument('--format', choices=SUPPORTED_FORMATS,
+                        help="Input format (default: detected from extension)")
+    parser.add_argument('--fields', default='text',
+                        help="Comma-separated CSV columns or JSONL keys to translate")
+    parser.add_argument('--concurrency', type=int, default=4,
+                        help="Number of records translated in parallel")
+    parser.add_argument('--checkpoint-every', type=int, default=500,
+                        help="Records between resume checkpoints")
+    parser.add_argument('--resume', action='store_true',
+                        help="Resume an interrupted job from its checkpoint")
+    args = parser.parse_args(argv)
+
+    bulk = BulkTranslator(concurrency=args.concurrency,
+                          checkpoint_every=args.checkpoint_every)
+    fields = [field.strip() for field in args.fields.split(',') if field.strip()]
+
+    try:
+        count = bulk.translate_file(args.input, args.output, fmt=args.format,
+                                    fields=fields, resume=args.resume)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Translated {count} records to {args.output} ({bulk.failures} failures)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
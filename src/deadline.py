@@ -0,0 +1,51 @@
+"""
+Deadline Module
+Request-level time budgets shared by every step of a translation
+"""
+
+import time
+from typing import Optional
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a request's time budget has run out"""
+
+
+class Deadline:
+    """A point in time by which a request must finish"""
+
+    def __init__(self, seconds: float):
+        """
+        Start a deadline
+
+        Args:
+            seconds: Budget from now, in seconds
+        """
+        self.budget = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left (negative once expired)"""
+        return self.expires_at - time.monotonic()
+
+    def expired(self) -> bool:
+        """Whether the budget has run out"""
+        return self.remaining() <= 0
+
+    def timeout(self, cap: Optional[float] = None) -> float:
+        """
+        Timeout to give the next blocking call
+
+        Args:
+            cap: Upper bound for this call (e.g. a per-backend timeout)
+
+        Returns:
+            Remaining budget, limited to cap
+
+        Raises:
+            DeadlineExceeded: If no budget is left
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Deadline of {self.budget:.1f}s exceeded")
+        return min(remaining, cap) if cap is not None else remaining
@@ -5,12 +5,21 @@ Built with tkinter for cross-platform compatibility
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from translator import EnglishKannadaTranslator
+from incremental import IncrementalTranslator
 from tts_engine import TTSEngine
 from speech_recognizer import SpeechRecognizer
 
 
+# How often the main loop drains finished background tasks (ms)
+RESULT_POLL_MS = 50
+
+# Typing pause before a translate-as-you-type request (ms)
+LIVE_TRANSLATE_DELAY_MS = 600
+
+
 class TranslatorGUI:
     """GUI Application for the translator"""
     
@@ -23,11 +32,75 @@ class TranslatorGUI:
         
         # Initialize components
         self.translator = EnglishKannadaTranslator()
+        # The English panel is one document: edits re-translate only changed sentences
+        self.incremental = IncrementalTranslator(self.translator, max_documents=1)
         self.tts = TTSEngine()
         self.recognizer = SpeechRecognizer()
         
+        # Background work runs on executors; workers never touch widgets.
+        # Finished tasks post UI updates to the results queue, which the main
+        # loop drains. Each task kind keeps a generation counter so results
+        # from superseded tasks are dropped. Speech gets its own single
+        # worker: pyttsx3's runAndWait() is not re-entrant.
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='gui')
+        self.speech_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gui-speech')
+        self.results = queue.Queue()
+        self.generations = {'translate': 0, 'speak': 0, 'listen': 0}
+        self.futures = {}
+        self.live_job = None
+        self.live_translate = tk.BooleanVar(value=False)
+        
         # Create GUI elements
         self.create_widgets()
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(RESULT_POLL_MS, self._drain_results)
+    
+    def submit(self, kind, func, *args, on_done=None):
+        """
+        Run func in the background, superseding any earlier task of the same kind
+        
+        Args:
+            kind: Task kind ('translate', 'speak' or 'listen')
+            func: Callable to run on a worker thread
+            *args: Arguments for func
+            on_done: Called on the main thread with (result, error) unless
+                a newer task of the same kind was submitted meanwhile
+        """
+        self.generations[kind] += 1
+        generation = self.generations[kind]
+        
+        previous = self.futures.get(kind)
+        if previous is not None:
+            previous.cancel()  # Only succeeds if it has not started yet
+        
+        def task():
+            try:
+                result, error = func(*args), None
+            except Exception as e:
+                result, error = None, e
+            if on_done:
+                self.results.put((kind, generation, on_done, result, error))
+        
+        executor = self.speech_executor if kind == 'speak' else self.executor
+        self.futures[kind] = executor.submit(task)
+    
+    def _drain_results(self):
+        """Apply finished background results on the Tk main thread"""
+        try:
+            while True:
+                kind, generation, on_done, result, error = self.results.get_nowait()
+                if generation == self.generations[kind]:
+                    on_done(result, error)
+        except queue.Empty:
+            pass
+        self.root.after(RESULT_POLL_MS, self._drain_results)
+    
+    def on_close(self):
+        """Stop background work and close the window"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.speech_executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
     
     def create_widgets(self):
         """Create all GUI widgets"""
@@ -78,6 +151,7 @@ class TranslatorGUI:
         # Store reference
         if section_type == 'english':
             self.english_text = text_widget
+            text_widget.bind("<KeyRelease>", self.schedule_live_translate)
         else:
             self.kannada_text = text_widget
         
@@ -140,6 +214,14 @@ class TranslatorGUI:
         )
         translate_btn.pack()
         
+        # Translate-as-you-type toggle
+        ttk.Checkbutton(
+            button_frame,
+            text="Translate as you type",
+            variable=self.live_translate,
+            command=self.schedule_live_translate
+        ).pack(pady=(5, 0))
+        
         # Status label
         self.status_label = ttk.Label(
             button_frame,
@@ -148,38 +230,58 @@ class TranslatorGUI:
         )
         self.status_label.pack(pady=5)
     
-    def translate(self):
-        """Translate English text to Kannada"""
+    def translate(self, live=False):
+        """
+        Translate English text to Kannada
+        
+        Args:
+            live: Triggered by typing; skips the warning and error dialogs
+        """
         english_text = self.english_text.get("1.0", tk.END).strip()
         
         if not english_text:
-            messagebox.showwarning("Input Error", "Please enter English text to translate.")
+            if not live:
+                messagebox.showwarning("Input Error", "Please enter English text to translate.")
             return
         
         # Update status
         self.status_label.config(text="Translating...", foreground="blue")
-        self.root.update()
         
-        # Run translation in a separate thread to avoid freezing GUI
-        thread = threading.Thread(target=self._translate_thread, args=(english_text,))
-        thread.daemon = True
-        thread.start()
+        self.submit('translate', self.incremental.translate, english_text, 'gui',
+                    on_done=lambda result, error: self._on_translated(result, error, live))
     
-    def _translate_thread(self, text):
-        """Run translation in background thread"""
-        try:
-            translated = self.translator.translate(text)
-            
-            if translated:
-                self.kannada_text.delete("1.0", tk.END)
-                self.kannada_text.insert("1.0", translated)
-                self.status_label.config(text="Translation complete!", foreground="green")
-            else:
-                self.status_label.config(text="Translation failed!", foreground="red")
+    def _on_translated(self, result, error, live):
+        """Show a translation result (main thread)"""
+        if error:
+            self.status_label.config(text=f"Error: {str(error)}", foreground="red")
+            if not live:
+                messagebox.showerror("Error", f"An error occurred: {str(error)}")
+        elif result and result['translation']:
+            self.kannada_text.delete("1.0", tk.END)
+            self.kannada_text.insert("1.0", result['translation'])
+            stale = " - saved translation, may be out of date" if result['stale'] else ""
+            self.status_label.config(
+                text=f"Translation complete! ({result['translated']} of {result['sentences']} "
+                     f"sentences translated{stale})",
+                foreground="green"
+            )
+        else:
+            self.status_label.config(text="Translation failed!", foreground="red")
+            if not live:
                 messagebox.showerror("Error", "Translation failed. Please try again.")
-        except Exception as e:
-            self.status_label.config(text=f"Error: {str(e)}", foreground="red")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+    
+    def schedule_live_translate(self, event=None):
+        """Debounce translate-as-you-type until the user pauses"""
+        if self.live_job is not None:
+            self.root.after_cancel(self.live_job)
+            self.live_job = None
+        if self.live_translate.get():
+            self.live_job = self.root.after(LIVE_TRANSLATE_DELAY_MS, self._run_live_translate)
+    
+    def _run_live_translate(self):
+        """Fire a debounced live translation"""
+        self.live_job = None
+        self.translate(live=True)
     
     def speak_text(self, text, language):
         """Speak the given text"""
@@ -188,33 +290,26 @@ class TranslatorGUI:
             messagebox.showwarning("Input Error", f"Please enter {language} text to speak.")
             return
         
-        # Run TTS in a separate thread
-        thread = threading.Thread(target=self.tts.speak, args=(text, language))
-        thread.daemon = True
-        thread.start()
+        self.submit('speak', self.tts.speak, text, language)
     
     def listen_from_mic(self):
         """Listen from microphone and fill English text"""
         self.status_label.config(text="Listening...", foreground="blue")
-        self.root.update()
         
-        thread = threading.Thread(target=self._listen_thread)
-        thread.daemon = True
-        thread.start()
+        self.submit('listen', self.recognizer.recognize_from_microphone,
+                    on_done=self._on_recognized)
     
-    def _listen_thread(self):
-        """Listen in background thread"""
-        try:
-            recognized_text = self.recognizer.recognize_from_microphone()
-            
-            if recognized_text:
-                self.english_text.delete("1.0", tk.END)
-                self.english_text.insert("1.0", recognized_text)
-                self.status_label.config(text="Recognized successfully!", foreground="green")
-            else:
-                self.status_label.config(text="Recognition failed!", foreground="red")
-        except Exception as e:
-            self.status_label.config(text=f"Error: {str(e)}", foreground="red")
+    def _on_recognized(self, recognized_text, error):
+        """Show a speech recognition result (main thread)"""
+        if error:
+            self.status_label.config(text=f"Error: {str(error)}", foreground="red")
+        elif recognized_text:
+            self.english_text.delete("1.0", tk.END)
+            self.english_text.insert("1.0", recognized_text)
+            self.status_label.config(text="Recognized successfully!", foreground="green")
+            self.schedule_live_translate()
+        else:
+            self.status_label.config(text="Recognition failed!", foreground="red")
     
     def copy_to_clipboard(self):
         """Copy Kannada text to clipboard"""
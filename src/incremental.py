@@ -0,0 +1,136 @@
+"""
+Incremental Translation Module
+Re-translates only the sentences that changed since a document's previous revision
+"""
+
+import hashlib
+import os
+import re
+import uuid
+from typing import List, Optional, Tuple
+
+from deadline import Deadline
+from text_templates import canonicalize
+from translation_cache import TranslationCache
+
+# Sentence ends (., !, ?, …, Devanagari/Kannada danda) followed by space,
+# or any line break; the separator is kept so the output keeps the layout
+_SENTENCE_BREAK = re.compile(r'(\s*\n\s*|(?<=[.!?…।])\s+)')
+
+# Previous revisions kept per process, and how long an idle one is kept (seconds)
+MAX_DOCUMENTS = int(os.getenv('INCREMENTAL_MAX_DOCUMENTS', 1000))
+DOCUMENT_TTL = float(os.getenv('INCREMENTAL_DOCUMENT_TTL', 3600))
+
+
+def split_sentences(text: str) -> Tuple[List[str], List[str]]:
+    """
+    Split text into sentences and the separators between them
+
+    Args:
+        text: Input text
+
+    Returns:
+        (sentences, separators), with len(separators) == len(sentences) - 1;
+        interleaving them gives back the original text
+    """
+    parts = _SENTENCE_BREAK.split(text)
+    return parts[0::2], parts[1::2]
+
+
+def sentence_key(sentence: str) -> str:
+    """Hash of a sentence's canonical form"""
+    return hashlib.blake2b(canonicalize(sentence).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class IncrementalTranslator:
+    """Translates documents sentence by sentence, reusing unchanged sentences"""
+
+    def __init__(self, translator, max_documents: int = MAX_DOCUMENTS,
+                 ttl: float = DOCUMENT_TTL, max_workers: int = 4):
+        """
+        Initialize the incremental translator
+
+        Args:
+            translator: EnglishKannadaTranslator used for changed sentences
+            max_documents: Previous revisions kept (least recently used are dropped)
+            ttl: Seconds an untouched document's revision is kept
+            max_workers: Changed sentences translated concurrently
+        """
+        self.translator = translator
+        self.max_workers = max_workers
+        # document id -> {sentence hash: translation} for its latest revision
+        self._revisions = TranslationCache(max_size=max_documents, ttl=ttl)
+
+    @staticmethod
+    def _diff(sentences: List[str], previous: dict) -> Tuple[List[Optional[str]], dict]:
+        """Sentence hashes (None for blank ones) and {hash: sentence} of those not in previous"""
+        keys = [sentence_key(sentence) if sentence.strip() else None for sentence in sentences]
+        changed = {}
+        for sentence, key in zip(sentences, keys):
+            if key and key not in previous and key not in changed:
+                changed[key] = sentence
+        return keys, changed
+
+    def changed_count(self, text: str, document_id: Optional[str] = None) -> int:
+        """
+        Number of distinct sentences a translate() call would send for translation
+
+        Used to size the work before queuing it; the document is not updated.
+        """
+        previous = (self._revisions.get(document_id) if document_id else None) or {}
+        return len(self._diff(split_sentences(text)[0], previous)[1])
+
+    def translate(self, text: str, document_id: Optional[str] = None,
+                  deadline: Optional[Deadline] = None) -> dict:
+        """
+        Translate a revision of a document
+
+        Args:
+            text: Full text of the new revision
+            document_id: Id of the document or editing session (a new one
+                is assigned if omitted)
+            deadline: Time budget for the changed sentences
+
+        Returns:
+            {'document_id', 'translation' (None if any changed sentence
+            failed), 'sentences', 'translated', 'reused', 'stale' (whether
+            any sentence came from an expired cache entry)}
+        """
+        document_id = document_id or uuid.uuid4().hex
+        previous = self._revisions.get(document_id) or {}
+        sentences, separators = split_sentences(text)
+        keys, changed = self._diff(sentences, previous)
+
+        current = {key: previous[key] for key in keys if key in previous}
+        stale = set()
+        if changed:
+            results, flags = self.translator.translate_batch_with_status(
+                list(changed.values()), max_workers=self.max_workers, deadline=deadline
+            )
+            for key, result, is_stale in zip(changed, results, flags):
+                if result:
+                    current[key] = result
+                    if is_stale:
+                        stale.add(key)
+
+        # Keep what succeeded, so a retry only re-sends the failures; stale
+        # sentences are looked up again next time, once they are refreshed
+        self._revisions.set(document_id, {key: value for key, value in current.items()
+                                          if key not in stale})
+
+        translation = None
+        if all(key is None or key in current for key in keys):
+            pieces = [current[key] if key else sentence for sentence, key in zip(sentences, keys)]
+            translation = pieces[0] + ''.join(
+                separator + piece for separator, piece in zip(separators, pieces[1:])
+            )
+
+        translatable = sum(1 for key in keys if key)
+        return {
+            'document_id': document_id,
+            'translation': translation,
+            'sentences': translatable,
+            'translated': len(changed),
+            'reused': translatable - sum(1 for key in keys if key in changed),
+            'stale': bool(stale),
+        }
@@ -0,0 +1,122 @@
+"""
+Mock Upstream Module
+Local stand-in for the Google Translate web endpoint, for load tests without network access
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+class MockUpstream:
+    """
+    HTTP server answering /translate_a/single like translate.googleapis.com
+
+    Translations are the input prefixed with the target code (e.g.
+    "[kn] Hello"), after a latency drawn around the configured mean.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.05, jitter: float = 0.5, error_rate: float = 0.0):
+        """
+        Initialize the server (not started)
+
+        Args:
+            host: Address to bind
+            port: Port to bind (0 picks a free one)
+            latency: Mean response delay in seconds
+            jitter: Delay varies uniformly by this fraction of the mean
+            error_rate: Fraction of requests answered with 503
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Endpoint URL to use as GOOGLE_WEB_URL"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/translate_a/single"
+
+    def _handler(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path != '/translate_a/single':
+                    self.send_error(404)
+                    return
+
+                with upstream._lock:
+                    upstream.calls += 1
+                delay = upstream.latency * (1 + upstream.jitter * (2 * random.random() - 1))
+                time.sleep(max(0.0, delay))
+
+                if random.random() < upstream.error_rate:
+                    self.send_error(503)
+                    return
+
+                params = parse_qs(parsed.query)
+                text = params.get('q', [''])[0]
+                target = params.get('tl', ['kn'])[0]
+                source = params.get('sl', ['en'])[0]
+                body = json.dumps([[[f"[{target}] {text}", text, None, None, 1]], None, source],
+                                  ensure_ascii=False).encode('utf-8')
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # One line per request would swamp a load test
+
+        return Handler
+
+    def start(self) -> 'MockUpstream':
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name='mock-upstream', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down"""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Run a mock Google Translate endpoint")
+    parser.add_argument('--host', default='127.0.0.1', help="Address to bind")
+    parser.add_argument('--port', type=int, default=8099, help="Port to bind")
+    parser.add_argument('--latency', type=float, default=0.05, help="Mean delay in seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help="Fraction of requests answered with 503")
+    args = parser.parse_args(argv)
+
+    upstream = MockUpstream(args.host, args.port, args.latency, error_rate=args.error_rate)
+    print(f"Mock upstream at {upstream.url} (set GOOGLE_WEB_URL to this)")
+    try:
+        upstream._server.serve_forever()
+    except KeyboardInterrupt:
+        upstream.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
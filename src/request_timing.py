@@ -0,0 +1,163 @@
+"""
+Request Timing Module
+Phase-level timers for Server-Timing headers and sampled request profiling
+"""
+
+import contextvars
+import cProfile
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from structured_logging import get_logger
+
+logger = get_logger('timing')
+
+# Timer of the request being handled (set by the web app)
+current_timer = contextvars.ContextVar('current_timer', default=None)
+
+
+class RequestTimer:
+    """Accumulates the time spent in named phases of one request"""
+
+    def __init__(self):
+        """Initialize the timer"""
+        self.start = time.perf_counter()
+        self.phases = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float):
+        """
+        Record time spent in a phase
+
+        Repeated phases are summed, including ones run in parallel threads
+        (e.g. batch backend calls), so phases can add up to more than total.
+
+        Args:
+            name: Phase name (a token: letters, digits, '_' or '-')
+            seconds: Duration in seconds
+        """
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def header(self) -> str:
+        """
+        Build the Server-Timing header value
+
+        Returns:
+            e.g. 'parse;dur=0.1, backend_google_web;dur=183.2, total;dur=184.0'
+        """
+        with self._lock:
+            phases = list(self.phases.items())
+        entries = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in phases]
+        entries.append(f"total;dur={(time.perf_counter() - self.start) * 1000:.1f}")
+        return ', '.join(entries)
+
+
+@contextmanager
+def timed(name: str):
+    """
+    Time a block as a phase of the current request
+
+    Does nothing (beyond a context variable lookup) outside a timed request,
+    e.g. in the GUI or the bulk translator.
+
+    Args:
+        name: Phase name
+    """
+    timer = current_timer.get()
+    if timer is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(name, time.perf_counter() - start)
+
+
+class RequestProfiler:
+    """Profiles a random sample of requests with cProfile"""
+
+    def __init__(self, sample_rate: Optional[float] = None, output_dir: Optional[str] = None):
+        """
+        Initialize the profiler
+
+        Args:
+            sample_rate: Fraction of requests to profile (default: PROFILE_SAMPLE_RATE env var or 0)
+            output_dir: Where .prof files are written (default: PROFILE_DIR env var or 'profiles')
+        """
+        if sample_rate is None:
+            sample_rate = float(os.getenv('PROFILE_SAMPLE_RATE', 0))
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self.output_dir = output_dir or os.getenv('PROFILE_DIR', 'profiles')
+
+    def maybe_start(self) -> Optional[cProfile.Profile]:
+        """
+        Start profiling if this request is sampled
+
+        Returns:
+            Running profile, or None if the request was not sampled
+        """
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler is already active on this thread
+            return None
+        return profile
+
+    @staticmethod
+    def run(profile: cProfile.Profile, func, *args):
+        """
+        Run a call with a profile enabled on the current thread
+
+        cProfile only sees the thread that enabled it, so work handed to
+        another thread (e.g. a scheduler worker) is profiled through this.
+        The profile must not be enabled on any other thread meanwhile.
+
+        Args:
+            profile: Profile returned by maybe_start
+            func: Callable to run
+            *args: Positional arguments for func
+
+        Returns:
+            The return value of func
+        """
+        try:
+            profile.enable()
+        except ValueError:
+            return func(*args)  # Another profiler is active on this thread
+        try:
+            return func(*args)
+        finally:
+            profile.disable()
+
+    def finish(self, profile: cProfile.Profile, name: str) -> Optional[str]:
+        """
+        Stop a profile and write it to disk for offline analysis
+
+        The file can be inspected with ``python -m pstats <file>`` or snakeviz.
+
+        Args:
+            profile: Profile returned by maybe_start
+            name: Identifier used in the file name (e.g. the request id)
+
+        Returns:
+            Path of the written file, or None on failure
+        """
+        profile.disable()
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            path = os.path.join(self.output_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{name}.prof")
+            profile.dump_stats(path)
+            return path
+        except OSError as e:
+            logger.error("Could not write profile: %s", e)
+            return None
@@ -0,0 +1,327 @@
+"""
+Request Scheduler Module
+Priority classes, weighted fair queuing across clients and load shedding for translation work
+"""
+
+import contextvars
+import heapq
+import itertools
+import math
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+from structured_logging import get_logger
+
+logger = get_logger('scheduler')
+
+# Priority classes, highest first
+PRIORITIES = ('interactive', 'bulk')
+
+
+class QueueFull(Exception):
+    """Raised when a priority class's queue is full and work is shed"""
+
+    def __init__(self, priority: str, retry_after: int):
+        super().__init__(f"{priority} queue is full, retry in {retry_after}s")
+        self.priority = priority
+        self.retry_after = retry_after
+
+
+def parse_pairs(spec: str) -> Dict[str, str]:
+    """
+    Parse 'name=value,...' into a dict (items missing either side are skipped)
+
+    Args:
+        spec: Specification string
+
+    Returns:
+        Name -> value
+    """
+    pairs = {}
+    for item in spec.split(','):
+        name, _, value = item.partition('=')
+        if name.strip() and value.strip():
+            pairs[name.strip()] = value.strip()
+    return pairs
+
+
+def parse_weights(spec: str) -> Dict[str, float]:
+    """
+    Parse client weights from 'client=weight,...' (e.g. 'partner-a=4,partner-b=2')
+
+    Args:
+        spec: Weight specification
+
+    Returns:
+        Client id -> weight
+    """
+    return {client: float(weight) for client, weight in parse_pairs(spec).items()}
+
+
+class _Job:
+    """One unit of queued work"""
+
+    __slots__ = ('func', 'args', 'context', 'future', 'client', 'cost', 'enqueued', 'taken')
+
+    def __init__(self, func, args, client: str, cost: float):
+        self.func = func
+        self.args = args
+        self.context = contextvars.copy_context()
+        self.future = Future()
+        self.client = client
+        self.cost = cost
+        self.enqueued = time.monotonic()
+        self.taken = False
+
+
+class _FairQueue:
+    """
+    Queue for one priority class, shared fairly between clients
+
+    Each job gets a virtual finish tag of max(virtual time, the client's
+    last tag) + cost / weight, and the smallest tag is served first, so a
+    client with a long backlog cannot delay another client's first job by
+    more than one job. A FIFO view of the same jobs gives the oldest one.
+    """
+
+    def __init__(self, max_depth: int):
+        self.max_depth = max_depth
+        self.depth = 0
+        self._heap = []
+        self._fifo = deque()
+        self._finish: Dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._seq = itertools.count()
+
+    def push(self, job: _Job, weight: float):
+        start = max(self._virtual_time, self._finish.get(job.client, 0.0))
+        tag = start + job.cost / weight
+        self._finish[job.client] = tag
+        heapq.heappush(self._heap, (tag, next(self._seq), job))
+        self._fifo.append(job)
+        self.depth += 1
+
+    def oldest(self) -> Optional[_Job]:
+        while self._fifo and self._fifo[0].taken:
+            self._fifo.popleft()
+        return self._fifo[0] if self._fifo else None
+
+    def pop(self) -> _Job:
+        while True:
+            tag, _, job = heapq.heappop(self._heap)
+            if not job.taken:
+                self._virtual_time = tag
+                return self.take(job)
+
+    def take(self, job: _Job) -> _Job:
+        job.taken = True
+        self.depth -= 1
+        if not self.depth:
+            # Idle: start every client afresh
+            self._heap.clear()
+            self._fifo.clear()
+            self._finish.clear()
+            self._virtual_time = 0.0
+        return job
+
+
+class TranslationScheduler:
+    """
+    Runs translation work on a fixed set of worker threads
+
+    Interactive work is always served before bulk work, except that a bulk
+    job waiting longer than bulk_max_wait goes next, so bulk traffic makes
+    progress under sustained interactive load. Within a class, clients
+    share the workers in proportion to their weights. Each class has a
+    bounded queue; work beyond it is rejected with QueueFull.
+    """
+
+    def __init__(self, workers: int = 16, max_queue: Optional[Dict[str, int]] = None,
+                 bulk_max_wait: float = 2.0, weights: Optional[Dict[str, float]] = None):
+        """
+        Initialize the scheduler
+
+        Args:
+            workers: Number of worker threads
+            max_queue: Queue depth per priority class
+            bulk_max_wait: Seconds after which a waiting bulk job is served ahead
+                of interactive work
+            weights: Client id -> weight (default 1)
+        """
+        max_queue = max_queue or {}
+        self.workers = workers
+        self.bulk_max_wait = bulk_max_wait
+        self.weights = weights or {}
+        self._queues = {priority: _FairQueue(max_queue.get(priority, 256)) for priority in PRIORITIES}
+        self._cond = threading.Condition()
+        self._pid = None
+        self._busy = 0
+        self._service_time = 0.05  # Moving average of job run time (seconds)
+        self._stats = {priority: {'completed': 0, 'cancelled': 0, 'shed': 0, 'promoted': 0}
+                       for priority in PRIORITIES}
+        self._wait = {priority: 0.0 for priority in PRIORITIES}  # Total queue wait (seconds)
+
+    def _ensure_started(self):
+        """Start the workers on first use (and again in a forked worker process)"""
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        for i in range(self.workers):
+            threading.Thread(target=self._work, name=f"scheduler-{i}", daemon=True).start()
+
+    def capacity(self, priority: str) -> int:
+        """Most calls a priority class's queue can hold"""
+        return self._queues[priority].max_depth
+
+    def retry_after(self, priority: str) -> int:
+        """Seconds a shed client should wait, estimated from queue depth"""
+        depth = sum(self._queues[p].depth for p in PRIORITIES[:PRIORITIES.index(priority) + 1])
+        return max(1, min(60, math.ceil(depth * self._service_time / self.workers)))
+
+    def submit_all(self, priority: str, client: str, calls: List[tuple],
+                   costs: Optional[List[float]] = None) -> List[Future]:
+        """
+        Queue several calls, all or none
+
+        Args:
+            priority: 'interactive' or 'bulk'
+            client: Client id used for fair sharing
+            calls: (func, *args) tuples
+            costs: Relative cost of each call (default 1 each)
+
+        Returns:
+            One future per call, in order
+
+        Raises:
+            QueueFull: If the calls do not fit in the class's queue
+            ValueError: If they would not fit even in an empty queue
+        """
+        queue = self._queues[priority]
+        weight = self.weights.get(client, 1.0)
+        costs = costs or [1] * len(calls)
+        if len(calls) > queue.max_depth:
+            raise ValueError(f"{len(calls)} calls exceed the {priority} queue's "
+                             f"capacity of {queue.max_depth}")
+
+        with self._cond:
+            self._ensure_started()
+            if queue.depth + len(calls) > queue.max_depth:
+                self._stats[priority]['shed'] += 1
+                raise QueueFull(priority, self.retry_after(priority))
+
+            jobs = [_Job(func, args, client, cost) for (func, *args), cost in zip(calls, costs)]
+            for job in jobs:
+                queue.push(job, weight)
+            self._cond.notify(len(jobs))
+        return [job.future for job in jobs]
+
+    def submit(self, priority: str, client: str, func, *args, cost: float = 1) -> Future:
+        """
+        Queue one call
+
+        Raises:
+            QueueFull: If the class's queue is full
+        """
+        return self.submit_all(priority, client, [(func, *args)], [cost])[0]
+
+    def _next_job(self):
+        """Pick the next job (called with the condition held)"""
+        interactive = self._queues['interactive']
+        bulk = self._queues['bulk']
+
+        oldest = bulk.oldest()
+        if oldest is not None and (not interactive.depth or
+                                   time.monotonic() - oldest.enqueued > self.bulk_max_wait):
+            if interactive.depth:
+                # Starvation protection: this one has waited long enough
+                self._stats['bulk']['promoted'] += 1
+                return 'bulk', bulk.take(oldest)
+            return 'bulk', bulk.pop()
+        return 'interactive', interactive.pop()
+
+    def _work(self):
+        """Worker loop"""
+        while True:
+            with self._cond:
+                while not any(queue.depth for queue in self._queues.values()):
+                    self._cond.wait()
+                priority, job = self._next_job()
+                self._busy += 1
+
+            # Skip jobs cancelled while queued (e.g. the caller's deadline passed)
+            start = time.monotonic()
+            ran = job.future.set_running_or_notify_cancel()
+            if ran:
+                try:
+                    job.future.set_result(job.context.run(job.func, *job.args))
+                except BaseException as e:
+                    job.future.set_exception(e)
+            elapsed = time.monotonic() - start
+
+            with self._cond:
+                self._busy -= 1
+                if ran:
+                    self._stats[priority]['completed'] += 1
+                    self._wait[priority] += start - job.enqueued
+                    self._service_time += 0.1 * (elapsed - self._service_time)
+                else:
+                    self._stats[priority]['cancelled'] += 1
+
+    def stats(self) -> dict:
+        """Queue depths, counters and the current service time estimate"""
+        with self._cond:
+            return {
+                'workers': self.workers,
+                'busy': self._busy,
+                'service_time_ms': round(self._service_time * 1000, 1),
+                'queues': {
+                    priority: {
+                        'depth': self._queues[priority].depth,
+                        'max_depth': self._queues[priority].max_depth,
+                        **self._stats[priority],
+                        'avg_wait_ms': round(self._wait[priority] * 1000 /
+                                             max(1, self._stats[priority]['completed']), 1),
+                    }
+                    for priority in PRIORITIES
+                },
+            }
+
+
+def _gevent_active() -> bool:
+    """Check whether threads are monkey-patched into greenlets"""
+    try:
+        from gevent import monkey
+        return monkey.is_module_patched('threading')
+    except ImportError:
+        return False
+
+
+def default_workers() -> int:
+    """
+    Worker count when SCHEDULER_WORKERS is not set
+
+    Threads are costly, so sync workers get 16. Under gevent the workers
+    are greenlets that yield while waiting on the upstream, so there is one
+    per connection (WORKER_CONNECTIONS) and slow upstream calls can overlap
+    as freely as the requests waiting on them.
+    """
+    if _gevent_active():
+        return int(os.getenv('WORKER_CONNECTIONS', 1000))
+    return 16
+
+
+def create_scheduler() -> TranslationScheduler:
+    """Build the scheduler from SCHEDULER_* environment variables"""
+    return TranslationScheduler(
+        workers=int(os.getenv('SCHEDULER_WORKERS') or default_workers()),
+        max_queue={
+            'interactive': int(os.getenv('SCHEDULER_INTERACTIVE_QUEUE', 256)),
+            'bulk': int(os.getenv('SCHEDULER_BULK_QUEUE', 512)),
+        },
+        bulk_max_wait=float(os.getenv('SCHEDULER_BULK_MAX_WAIT', 2.0)),
+        weights=parse_weights(os.getenv('SCHEDULER_CLIENT_WEIGHTS', '')),
+    )
@@ -0,0 +1,121 @@
+"""
+Script Detection Module
+Offline classification of input text by Unicode script, used to skip or route translations
+"""
+
+from collections import Counter
+from typing import Optional
+
+# The Indic scripts each occupy one aligned 128-code-point block, so a
+# character's script is a single shift and dictionary lookup
+_BLOCK_SCRIPTS = {
+    0x0900 >> 7: 'devanagari',
+    0x0980 >> 7: 'bengali',
+    0x0A00 >> 7: 'gurmukhi',
+    0x0A80 >> 7: 'gujarati',
+    0x0B00 >> 7: 'oriya',
+    0x0B80 >> 7: 'tamil',
+    0x0C00 >> 7: 'telugu',
+    0x0C80 >> 7: 'kannada',
+    0x0D00 >> 7: 'malayalam',
+    0x0600 >> 7: 'arabic',
+    0x0680 >> 7: 'arabic',
+}
+
+# Script of each supported language code
+LANGUAGE_SCRIPTS = {
+    'en': 'latin',
+    'kn': 'kannada',
+    'hi': 'devanagari',
+    'mr': 'devanagari',
+    'sa': 'devanagari',
+    'ta': 'tamil',
+    'te': 'telugu',
+    'ml': 'malayalam',
+    'bn': 'bengali',
+    'as': 'bengali',
+    'gu': 'gujarati',
+    'pa': 'gurmukhi',
+    'or': 'oriya',
+    'ur': 'arabic',
+}
+
+# Language assumed for text in a script when the configured source uses another one
+SCRIPT_LANGUAGES = {
+    'latin': 'en',
+    'kannada': 'kn',
+    'devanagari': 'hi',
+    'tamil': 'ta',
+    'telugu': 'te',
+    'malayalam': 'ml',
+    'bengali': 'bn',
+    'gujarati': 'gu',
+    'gurmukhi': 'pa',
+    'oriya': 'or',
+    'arabic': 'ur',
+}
+
+# Only the start of long inputs is inspected
+SAMPLE_CHARS = 2000
+
+# Share of letters a script needs to count as the text's script
+MIN_SHARE = 0.6
+
+
+def detect_script(text: str, sample: int = SAMPLE_CHARS) -> Optional[str]:
+    """
+    Find the dominant script of a text
+
+    Args:
+        text: Input text
+        sample: Number of leading characters to inspect
+
+    Returns:
+        Script name (e.g. 'kannada', 'latin'), 'mixed' if no script has
+        MIN_SHARE of the letters, or None if the text has no letters at all
+        (only digits, punctuation, symbols or whitespace)
+    """
+    counts = Counter()
+    for char in text[:sample]:
+        code = ord(char)
+        if code < 0x0250:
+            if char.isalpha():
+                counts['latin'] += 1
+        elif code >> 7 in _BLOCK_SCRIPTS:
+            # Vowel signs and viramas count too, though they are marks, not letters
+            counts[_BLOCK_SCRIPTS[code >> 7]] += 1
+        elif char.isalpha():
+            counts['other'] += 1
+
+    if not counts:
+        return None
+
+    script, count = counts.most_common(1)[0]
+    if count < MIN_SHARE * sum(counts.values()):
+        return 'mixed'
+    return script
+
+
+def route(text: str, source: str, target: str) -> Optional[str]:
+    """
+    Decide which source language to translate a text from
+
+    Args:
+        text: Input text
+        source: Configured source language code
+        target: Target language code
+
+    Returns:
+        None if the text needs no translation (no letters, or already in
+        the target's script), else the source language to use: the
+        configured one unless the text is clearly in another script
+    """
+    script = detect_script(text)
+    if script is None:
+        return None
+    # Checked before the target, so e.g. hi -> mr (both Devanagari) still translates
+    if script == LANGUAGE_SCRIPTS.get(source) or script not in SCRIPT_LANGUAGES:
+        return source
+    if script == LANGUAGE_SCRIPTS.get(target):
+        return None
+    return SCRIPT_LANGUAGES[script]
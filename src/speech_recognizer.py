@@ -10,7 +10,18 @@ except (ImportError, ModuleNotFoundError):
     SPEECH_RECOGNITION_AVAILABLE = False
     sr = None
 
-from typing import Optional
+import io
+import os
+import time
+from typing import Optional, Union
+
+from structured_logging import get_logger
+from audio_preprocessing import NUMPY_AVAILABLE, decode_pcm, preprocess, read_wav
+
+logger = get_logger('speech')
+
+# Shrink audio (mono, 16 kHz, normalized, silence trimmed) before upload
+AUDIO_PREPROCESS = os.getenv('AUDIO_PREPROCESS', 'true').lower() == 'true'
 
 
 class SpeechRecognizer:
@@ -31,7 +42,7 @@ class SpeechRecognizer:
             with self.microphone as source:
                 self.recognizer.adjust_for_ambient_noise(source, duration=1)
         except Exception as e:
-            print(f"Warning: Speech recognizer initialization failed: {e}")
+            logger.warning("Speech recognizer initialization failed: %s", e)
             self.recognizer = None
             self.microphone = None
     
@@ -47,49 +58,106 @@ class SpeechRecognizer:
             
         try:
             with self.microphone as source:
-                print("Listening... Please speak now.")
+                logger.info("Listening... Please speak now.")
                 audio = self.recognizer.listen(source, timeout=10)
             
-            print("Processing audio...")
+            logger.info("Processing audio...")
+            audio = self._preprocess_audio(audio)
+            start = time.perf_counter()
             text = self.recognizer.recognize_google(audio, language='en-US')
-            print(f"Recognized: {text}")
+            logger.info("Recognized speech", extra={
+                'backend': 'google_speech',
+                'latency_ms': round((time.perf_counter() - start) * 1000, 1),
+                'outcome': 'success',
+            })
             return text
         
         except sr.UnknownValueError:
-            print("Could not understand the audio. Please try again.")
+            logger.info("Could not understand the audio", extra={'outcome': 'unrecognized'})
             return None
         except sr.RequestError as e:
-            print(f"Speech recognition error: {e}")
+            logger.error("Speech recognition error: %s", e,
+                         extra={'backend': 'google_speech', 'outcome': 'error'})
             return None
         except Exception as e:
-            print(f"Error: {e}")
+            logger.error("Error: %s", e, extra={'outcome': 'error'})
             return None
     
-    def recognize_from_file(self, audio_file: str) -> Optional[str]:
+    def _preprocess_audio(self, audio, wav_bytes: Optional[bytes] = None):
+        """
+        Downmix, downsample to 16 kHz, normalize and trim a recording in memory
+        
+        Args:
+            audio: Recording as sr.AudioData (already mono)
+            wav_bytes: Original WAV file, decoded directly when given so
+                multi-channel input is downmixed with NumPy
+            
+        Returns:
+            Processed sr.AudioData, or the input if preprocessing is off,
+            NumPy is missing or the audio cannot be processed
+        """
+        if not AUDIO_PREPROCESS or not NUMPY_AVAILABLE:
+            return audio
+        
+        start = time.perf_counter()
+        try:
+            samples, rate = None, audio.sample_rate
+            if wav_bytes is not None:
+                try:
+                    samples, rate = read_wav(wav_bytes)
+                except ValueError:
+                    samples = None  # Not PCM WAV: use what AudioFile decoded
+            if samples is None:
+                # AudioData holds signed samples, 8-bit included
+                samples = decode_pcm(audio.get_raw_data(), audio.sample_width, unsigned_8bit=False)
+            
+            pcm, rate = preprocess(samples, rate)
+        except Exception as e:
+            logger.warning("Audio preprocessing failed, sending original: %s", e)
+            return audio
+        
+        original_size = len(wav_bytes) if wav_bytes is not None else len(audio.get_raw_data())
+        logger.debug("Preprocessed audio: %d -> %d bytes", original_size, len(pcm), extra={
+            'latency_ms': round((time.perf_counter() - start) * 1000, 1),
+        })
+        return sr.AudioData(pcm, rate, 2)
+    
+    def recognize_from_file(self, audio_file: Union[str, bytes]) -> Optional[str]:
         """
         Recognize speech from an audio file
         
         Args:
-            audio_file: Path to audio file (.wav, .mp3, etc.)
+            audio_file: Path to audio file (.wav, .aiff, .flac) or its contents
             
         Returns:
             Recognized text or None
         """
+        if not SPEECH_RECOGNITION_AVAILABLE or not self.recognizer:
+            return None
+        
         try:
-            with sr.AudioFile(audio_file) as source:
+            if isinstance(audio_file, bytes):
+                data = audio_file
+            else:
+                with open(audio_file, 'rb') as handle:
+                    data = handle.read()
+            
+            with sr.AudioFile(io.BytesIO(data)) as source:
                 audio = self.recognizer.record(source)
+            audio = self._preprocess_audio(audio, data)
             
             text = self.recognizer.recognize_google(audio, language='en-US')
             return text
         
         except sr.UnknownValueError:
-            print("Could not understand the audio file.")
+            logger.info("Could not understand the audio file", extra={'outcome': 'unrecognized'})
             return None
         except sr.RequestError as e:
-            print(f"Speech recognition error: {e}")
+            logger.error("Speech recognition error: %s", e,
+                         extra={'backend': 'google_speech', 'outcome': 'error'})
             return None
         except Exception as e:
-            print(f"Error processing audio file: {e}")
+            logger.error("Error processing audio file: %s", e, extra={'outcome': 'error'})
             return None
 
 
@@ -0,0 +1,209 @@
+"""
+Structured Logging Module
+Queue-backed, non-blocking logging with JSON records and rate-limited dedup
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+
+ROOT_LOGGER = 'translator'
+
+# Request id of the request being handled (set by the web app)
+request_id_var = contextvars.ContextVar('request_id', default=None)
+
+# Extra attributes copied into structured records when present
+STRUCTURED_FIELDS = ('backend', 'latency_ms', 'outcome', 'request_id', 'suppressed')
+
+_listener = None
+_configure_lock = threading.Lock()
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats records as one JSON object per line"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable formatter that appends the structured fields"""
+
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+    def format(self, record):
+        line = super().format(record)
+        fields = [
+            f"{field}={getattr(record, field)}"
+            for field in STRUCTURED_FIELDS
+            if getattr(record, field, None) is not None
+        ]
+        return f"{line} [{' '.join(fields)}]" if fields else line
+
+
+class RequestIdFilter(logging.Filter):
+    """Attaches the current request id to every record"""
+
+    def filter(self, record):
+        if getattr(record, 'request_id', None) is None:
+            record.request_id = request_id_var.get()
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Drops repeats of the same warning or error beyond a burst per time window
+
+    Records are grouped by logger, level and unformatted message, so an
+    upstream outage logs the first few errors and then a periodic summary
+    (the ``suppressed`` count) instead of one line per request. INFO and
+    DEBUG records are left to the level setting.
+    """
+
+    def __init__(self, burst: int = 5, window: float = 60.0):
+        """
+        Args:
+            burst: Records let through per key and window
+            window: Window length in seconds
+        """
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self._lock = threading.Lock()
+        self._state = {}
+
+    def filter(self, record):
+        if record.levelno < logging.WARNING or record.levelno >= logging.CRITICAL:
+            return True
+
+        key = (record.name, record.levelno, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            start, count, suppressed = self._state.get(key, (now, 0, 0))
+            if now - start >= self.window:
+                start, count = now, 0
+                if suppressed:
+                    record.suppressed = suppressed
+                suppressed = 0
+            if count < self.burst:
+                self._state[key] = (start, count + 1, suppressed)
+                return True
+            self._state[key] = (start, count, suppressed + 1)
+            return False
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full"""
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def configure_logging(level: Optional[str] = None, fmt: Optional[str] = None,
+                      stream=None, force: bool = False):
+    """
+    Route the translator's loggers through a background-thread queue listener
+
+    Callers only pay for putting the record on a queue; formatting and the
+    write to the sink happen on the listener thread.
+
+    Args:
+        level: Log level name (default: LOG_LEVEL env var or INFO)
+        fmt: 'json' or 'text' (default: LOG_FORMAT env var or json)
+        stream: Output stream (default: stderr)
+        force: Reconfigure even if logging was already configured
+    """
+    global _listener
+
+    with _configure_lock:
+        if _listener and not force:
+            return
+        if _listener:
+            _listener.stop()
+
+        level = (level or os.getenv('LOG_LEVEL', 'INFO')).upper()
+        fmt = (fmt or os.getenv('LOG_FORMAT', 'json')).lower()
+
+        sink = logging.StreamHandler(stream or sys.stderr)
+        sink.setFormatter(JSONFormatter() if fmt == 'json' else TextFormatter())
+
+        log_queue = queue.Queue(maxsize=int(os.getenv('LOG_QUEUE_SIZE', 10000)))
+        handler = DroppingQueueHandler(log_queue)
+        handler.addFilter(RequestIdFilter())
+        handler.addFilter(RateLimitFilter(
+            burst=int(os.getenv('LOG_DEDUP_BURST', 5)),
+            window=float(os.getenv('LOG_DEDUP_WINDOW', 60)),
+        ))
+
+        root = logging.getLogger(ROOT_LOGGER)
+        root.handlers = [handler]
+        root.setLevel(level)
+        root.propagate = False
+
+        _listener = logging.handlers.QueueListener(log_queue, sink)
+        _listener.start()
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+
+    with _configure_lock:
+        if _listener:
+            _listener.stop()
+            _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger under the translator namespace, configuring logging on first use
+
+    Args:
+        name: Component name (e.g. 'translator', 'tts')
+
+    Returns:
+        Logger instance
+    """
+    configure_logging()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def _reinit_after_fork():
+    """Restart the listener thread in forked workers (threads do not survive fork)"""
+    global _listener, _configure_lock
+
+    _configure_lock = threading.Lock()
+    if _listener:
+        _listener = None
+        configure_logging()
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reinit_after_fork)
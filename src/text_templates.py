@@ -0,0 +1,116 @@
+"""
+Text Template Module
+Canonicalizes input and swaps non-translatable spans for placeholders
+"""
+
+import os
+import re
+import unicodedata
+from typing import List, Optional
+
+
+# Spans that never need translating, most specific first
+_PROTECTED = re.compile(
+    r'`[^`\n]+`'                                   # inline code
+    r'|\b(?:https?://|www\.)[^\s<>"]+[^\s<>".,;:!?)\]]'  # URLs
+    r'|(?<![\w.+-])[\w.+-]+@[\w-]+(?:\.[\w-]+)+\b'  # email addresses (start of a run only, so linear)
+    r'|(?<![\w@])@\w+'                             # @handles
+    r'|(?<![\w.])[-+]?\d+(?:[.,:/]\d+)*%?'         # numbers, times, dates, percentages
+)
+
+_PLACEHOLDER = re.compile(r'\{(\d+)\}')
+
+# Runs of whitespace inside a line (line breaks are kept)
+_INLINE_SPACE = re.compile(r'[^\S\n]+')
+
+# Longer texts are not scanned for protected spans (translated as given)
+MAX_TEMPLATE_LENGTH = int(os.getenv('TEMPLATE_MAX_LENGTH', 20000))
+
+_NUMBER = re.compile(r'[-+]?\d+(?:[.,:/]\d+)*%?')
+
+_KANNADA_DIGITS = str.maketrans('0123456789', '೦೧೨೩೪೫೬೭೮೯')
+
+
+def canonicalize(text: str, casefold: bool = False) -> str:
+    """
+    Normalize Unicode (NFC) and whitespace
+
+    Runs of spaces and tabs collapse to one space and trailing spaces are
+    dropped, but line breaks and indentation are kept, so paragraphs and
+    lists keep their layout.
+
+    Args:
+        text: Input text
+        casefold: Also lowercase the text
+
+    Returns:
+        Canonical text
+    """
+    lines = []
+    for line in unicodedata.normalize('NFC', text).replace('\r\n', '\n').replace('\r', '\n').split('\n'):
+        body = line.lstrip()
+        indent = line[:len(line) - len(body)]
+        lines.append(indent + _INLINE_SPACE.sub(' ', body).rstrip())
+    text = '\n'.join(lines).strip()
+    return text.lower() if casefold else text
+
+
+class TextTemplate:
+    """Input text split into a translatable template and placeholder values"""
+
+    def __init__(self, text: str, casefold: bool = False):
+        """
+        Build the template
+
+        Args:
+            text: Input text
+            casefold: Lowercase the template (values keep their case)
+        """
+        self.values: List[str] = []
+        canonical = canonicalize(text)
+
+        # Braces in the input would be mistaken for placeholders, and very
+        # long input isn't worth scanning
+        if '{' in canonical or '}' in canonical or len(canonical) > MAX_TEMPLATE_LENGTH:
+            self.text = canonicalize(canonical, casefold)
+            return
+
+        def protect(match):
+            self.values.append(match.group())
+            return f"{{{len(self.values) - 1}}}"
+
+        self.text = canonicalize(_PROTECTED.sub(protect, canonical), casefold)
+
+    @property
+    def translatable(self) -> bool:
+        """Whether anything other than placeholders and punctuation is left"""
+        return bool(re.search(r'[^\W\d_]', _PLACEHOLDER.sub('', self.text)))
+
+    def fill(self, translated: str, kannada_numerals: bool = False) -> Optional[str]:
+        """
+        Put the original values back into a translated template
+
+        Args:
+            translated: Translation of self.text
+            kannada_numerals: Write the digits of numeric values as Kannada numerals
+
+        Returns:
+            Final text, or None if the translation lost or invented a placeholder
+        """
+        found = sorted(int(index) for index in _PLACEHOLDER.findall(translated))
+        if found != list(range(len(self.values))):
+            return None
+
+        def substitute(match):
+            value = self.values[int(match.group(1))]
+            if kannada_numerals and _NUMBER.fullmatch(value):
+                return value.translate(_KANNADA_DIGITS)
+            return value
+
+        return _PLACEHOLDER.sub(substitute, translated)
+
+    def render_untranslated(self, kannada_numerals: bool = False) -> str:
+        """Fill the template without translating it (nothing translatable in it)"""
+        if not self.values:
+            return self.text
+        return self.fill(self.text, kannada_numerals)
@@ -0,0 +1,130 @@
+"""
+Traffic Recorder Module
+Opt-in sampling of API requests to a compact JSONL log for replay load tests
+"""
+
+import gzip
+import json
+import os
+import random
+import threading
+import time
+from typing import Iterator, List, Optional
+
+from structured_logging import get_logger
+
+logger = get_logger('recorder')
+
+# Longest request body kept in a record (UTF-8 bytes); longer bodies are left
+# out and the record is flagged unreplayable, since a cut JSON body is invalid
+MAX_BODY = 64 * 1024
+
+
+class TrafficRecorder:
+    """
+    Appends one JSON line per sampled /api/* request
+
+    Records are short-keyed to keep the log small:
+    t (wall-clock seconds), m (method), p (path), q (query string),
+    b (JSON request body), s (status code), ms (latency in milliseconds),
+    u (1 if the body was too large to record, so the request cannot be replayed).
+    """
+
+    def __init__(self, path: str, sample_rate: float = 1.0, max_body: int = MAX_BODY):
+        """
+        Initialize the recorder
+
+        Args:
+            path: Log file to append to
+            sample_rate: Fraction of requests recorded (0-1)
+            max_body: Longest body recorded, in bytes
+        """
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_body = max_body
+        self.recorded = 0
+        self._lock = threading.Lock()
+        # Unbuffered append: each record is one write(), so several worker
+        # processes can share the file without interleaving lines
+        self._file = open(path, 'ab', buffering=0)
+
+    def sample(self) -> bool:
+        """Whether to record the current request"""
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def record(self, method: str, path: str, query: str, body: Optional[str],
+               status: int, latency_ms: float):
+        """
+        Write one record
+
+        Args:
+            method: HTTP method
+            path: Request path
+            query: Query string (may be empty)
+            body: JSON request body, or None for non-JSON requests
+            status: Response status code
+            latency_ms: Time to produce the response
+        """
+        entry = {'t': round(time.time(), 3), 'm': method, 'p': path,
+                 's': status, 'ms': round(latency_ms, 1)}
+        if query:
+            entry['q'] = query
+        if body:
+            if len(body.encode('utf-8')) <= self.max_body:
+                entry['b'] = body
+            else:
+                entry['u'] = 1
+        line = (json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+        try:
+            with self._lock:
+                self._file.write(line)
+                self.recorded += 1
+        except OSError as e:
+            logger.warning("Could not write traffic record: %s", e)
+
+    def close(self):
+        """Close the log file"""
+        with self._lock:
+            self._file.close()
+
+
+def create_recorder() -> Optional[TrafficRecorder]:
+    """
+    Build the recorder from TRAFFIC_RECORD_PATH / TRAFFIC_SAMPLE_RATE
+
+    Returns:
+        A recorder, or None if recording is disabled (no path set)
+    """
+    path = os.getenv('TRAFFIC_RECORD_PATH')
+    if not path:
+        return None
+    recorder = TrafficRecorder(path, float(os.getenv('TRAFFIC_SAMPLE_RATE', 1.0)))
+    logger.info("Recording %.0f%% of API traffic to %s", recorder.sample_rate * 100, path)
+    return recorder
+
+
+def read_records(paths: List[str]) -> Iterator[dict]:
+    """
+    Read records from one or more logs (plain or .gz), oldest first
+
+    Args:
+        paths: Log files
+
+    Returns:
+        Records sorted by timestamp
+    """
+    records = []
+    for path in paths:
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rt', encoding='utf-8') as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue  # Torn last line of a log still being written
+    records.sort(key=lambda record: record['t'])
+    return iter(records)
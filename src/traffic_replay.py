@@ -0,0 +1,291 @@
+"""
+Traffic Replay Module
+Replays recorded API traffic against the app and reports throughput, latency and cache effectiveness
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+
+from traffic_recorder import read_records
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values (0 if empty)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def build_schedule(records, speed: float = 1.0, qps: Optional[float] = None,
+                   include: Optional[List[str]] = None) -> List[dict]:
+    """
+    Turn records into requests with send offsets
+
+    Args:
+        records: Recorded requests, oldest first
+        speed: Replay speed factor (2.0 sends at twice the recorded rate)
+        qps: Fixed send rate instead of the recorded timing
+        include: Path prefixes to replay (default: all)
+
+    Returns:
+        Requests with an 'at' offset in seconds from the start
+    """
+    schedule = []
+    first = None
+    for record in records:
+        if include and not any(record['p'].startswith(prefix) for prefix in include):
+            continue
+        # Bodies of uploads (e.g. audio) and oversized bodies are not recorded,
+        # so those requests cannot be replayed
+        if record.get('u') or (record['m'] == 'POST' and 'b' not in record):
+            continue
+        if first is None:
+            first = record['t']
+        at = len(schedule) / qps if qps else (record['t'] - first) / speed
+        schedule.append({**record, 'at': at})
+    return schedule
+
+
+class Replayer:
+    """Sends a schedule of requests open-loop and collects the outcomes"""
+
+    def __init__(self, base_url: str, concurrency: int = 64, timeout: float = 30):
+        """
+        Initialize the replayer
+
+        Args:
+            base_url: App URL, e.g. http://127.0.0.1:5000
+            concurrency: Most requests in flight at once
+            timeout: Per-request timeout in seconds
+        """
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def _send(self, entry: dict, scheduled: float) -> dict:
+        url = self.base_url + entry['p'] + (f"?{entry['q']}" if entry.get('q') else '')
+        try:
+            response = self._session().request(
+                entry['m'], url, data=entry.get('b', '').encode('utf-8') or None,
+                headers={'Content-Type': 'application/json'}, timeout=self.timeout
+            )
+            status = response.status_code
+        except requests.RequestException:
+            status = 0
+        # Measured from the scheduled send time, so time spent waiting for a
+        # free client slot counts against the server (no coordinated omission)
+        return {'path': entry['p'], 'status': status,
+                'latency_ms': (time.perf_counter() - scheduled) * 1000}
+
+    def run(self, schedule: List[dict]) -> List[dict]:
+        """
+        Send every request at its offset
+
+        Returns:
+            One result per request: path, status (0 on connection errors)
+            and latency_ms
+        """
+        start = time.perf_counter()
+        futures = []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for entry in schedule:
+                scheduled = start + entry['at']
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(pool.submit(self._send, entry, scheduled))
+        return [future.result() for future in futures]
+
+
+def summarize(results: List[dict], duration: float, before: Optional[dict] = None,
+              after: Optional[dict] = None, upstream_calls: Optional[int] = None) -> dict:
+    """
+    Build the replay report
+
+    Args:
+        results: Replayer.run() output
+        duration: Wall-clock seconds of the replay
+        before: /api/health response before the replay
+        after: /api/health response after the replay
+        upstream_calls: Requests the mock upstream served
+
+    Returns:
+        Report with overall and per-path throughput, latency percentiles,
+        error rates and cache effectiveness
+    """
+    def stats(group):
+        latencies = [result['latency_ms'] for result in group]
+        errors = sum(1 for result in group if not 200 <= result['status'] < 400)
+        return {
+            'requests': len(group),
+            'throughput_rps': round(len(group) / duration, 1) if duration else 0.0,
+            'p50_ms': round(percentile(latencies, 50), 1),
+            'p90_ms': round(percentile(latencies, 90), 1),
+            'p99_ms': round(percentile(latencies, 99), 1),
+            'max_ms': round(max(latencies, default=0.0), 1),
+            'error_rate': round(errors / len(group), 4) if group else 0.0,
+        }
+
+    by_path: Dict[str, List[dict]] = {}
+    statuses: Dict[str, int] = {}
+    for result in results:
+        by_path.setdefault(result['path'], []).append(result)
+        statuses[str(result['status'])] = statuses.get(str(result['status']), 0) + 1
+
+    report = {
+        'duration_s': round(duration, 2),
+        'overall': stats(results),
+        'paths': {path: stats(group) for path, group in sorted(by_path.items())},
+        'statuses': statuses,
+    }
+
+    if before and after:
+        cache = {}
+        for name in ('cache', 'negative_cache'):
+            if name in before and name in after:
+                hits = after[name]['hits'] - before[name]['hits']
+                misses = after[name]['misses'] - before[name]['misses']
+                cache[name] = {'hits': hits, 'misses': misses,
+                               'hit_rate': round(hits / (hits + misses), 3) if hits + misses else 0.0}
+        report['cache'] = cache
+    if upstream_calls is not None:
+        report['upstream_calls'] = upstream_calls
+        report['upstream_calls_per_request'] = round(upstream_calls / len(results), 3) if results else 0.0
+    return report
+
+
+def format_report(report: dict) -> str:
+    """Render a report as a text table"""
+    lines = [f"Replayed {report['overall']['requests']} requests in {report['duration_s']}s"]
+    header = f"{'path':<28}{'reqs':>7}{'rps':>8}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}{'errors':>9}"
+    lines += ['', header, '-' * len(header)]
+    for path, row in [*report['paths'].items(), ('(all)', report['overall'])]:
+        lines.append(f"{path:<28}{row['requests']:>7}{row['throughput_rps']:>8}"
+                     f"{row['p50_ms']:>9}{row['p90_ms']:>9}{row['p99_ms']:>9}{row['max_ms']:>9}"
+                     f"{row['error_rate']:>9.2%}")
+    lines += ['', "Status codes: " + ', '.join(f"{code}: {count}" for code, count
+                                              in sorted(report['statuses'].items()))]
+    for name, cache in report.get('cache', {}).items():
+        lines.append(f"{name}: {cache['hits']} hits, {cache['misses']} misses "
+                     f"({cache['hit_rate']:.1%} hit rate)")
+    if 'upstream_calls' in report:
+        lines.append(f"Upstream calls: {report['upstream_calls']} "
+                     f"({report['upstream_calls_per_request']} per request)")
+    return '\n'.join(lines)
+
+
+def start_local_app(latency: float, error_rate: float):
+    """
+    Serve the app in-process against a local mock upstream
+
+    Must run before anything imports the translator, since backends read
+    their configuration at import time.
+
+    Returns:
+        (base_url, upstream, stop) where stop() shuts both servers down
+    """
+    from mock_upstream import MockUpstream
+    upstream = MockUpstream(latency=latency, error_rate=error_rate).start()
+
+    os.environ['GOOGLE_WEB_URL'] = upstream.url
+    os.environ['TRANSLATION_BACKENDS'] = 'google_web'
+    os.environ.pop('TRAFFIC_RECORD_PATH', None)  # Don't record the replay itself
+
+    from werkzeug.serving import WSGIRequestHandler, make_server
+    import app as web_app
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass  # The report covers every request
+
+    server = make_server('127.0.0.1', 0, web_app.app, threaded=True,
+                         request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, name='replay-app', daemon=True).start()
+
+    def stop():
+        server.shutdown()
+        upstream.stop()
+
+    return f"http://127.0.0.1:{server.server_port}", upstream, stop
+
+
+def _health(base_url: str) -> Optional[dict]:
+    try:
+        return requests.get(base_url + '/api/health', timeout=5).json()
+    except (requests.RequestException, ValueError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Replay recorded API traffic as a load test")
+    parser.add_argument('logs', nargs='+', help="Traffic logs written with TRAFFIC_RECORD_PATH")
+    parser.add_argument('--url',
+                        help="Running app to target (default: start one in-process "
+                             "against a local mock upstream)")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="Replay speed factor (2 = twice the recorded QPS)")
+    parser.add_argument('--qps', type=float, help="Send at a fixed rate instead")
+    parser.add_argument('--include', default='',
+                        help="Comma-separated path prefixes to replay (default: all)")
+    parser.add_argument('--concurrency', type=int, default=64,
+                        help="Most requests in flight at once")
+    parser.add_argument('--upstream-latency', type=float, default=0.05,
+                        help="Mock upstream mean latency in seconds")
+    parser.add_argument('--upstream-error-rate', type=float, default=0.0,
+                        help="Fraction of mock upstream calls that fail")
+    parser.add_argument('--json', dest='json_path', help="Also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    include = [prefix.strip() for prefix in args.include.split(',') if prefix.strip()]
+    try:
+        schedule = build_schedule(read_records(args.logs), args.speed, args.qps, include)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    if not schedule:
+        print("Error: no replayable requests in the logs", file=sys.stderr)
+        return 1
+
+    upstream, stop = None, None
+    base_url = args.url
+    if not base_url:
+        base_url, upstream, stop = start_local_app(args.upstream_latency, args.upstream_error_rate)
+
+    try:
+        before = _health(base_url)
+        start = time.perf_counter()
+        results = Replayer(base_url, args.concurrency).run(schedule)
+        duration = time.perf_counter() - start
+        after = _health(base_url)
+    finally:
+        if stop:
+            stop()
+
+    report = summarize(results, duration, before, after,
+                       upstream.calls if upstream else None)
+    print(format_report(report))
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
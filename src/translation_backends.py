@@ -0,0 +1,602 @@
+"""
+Translation Backends Module
+Backend interface, registry and a dispatcher that enforces per-backend limits
+"""
+
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from dotenv import load_dotenv
+
+from structured_logging import get_logger
+from request_timing import timed
+from deadline import Deadline, DeadlineExceeded
+
+# Try to use Google Cloud, fallback to deep-translator
+try:
+    from google.cloud import translate_v2
+    GOOGLE_CLOUD_AVAILABLE = True
+except ImportError:
+    GOOGLE_CLOUD_AVAILABLE = False
+
+try:
+    from deep_translator import GoogleTranslator
+    DEEP_TRANSLATOR_AVAILABLE = True
+except ImportError:
+    DEEP_TRANSLATOR_AVAILABLE = False
+
+load_dotenv()
+
+logger = get_logger('backends')
+
+# Default upper bound for a single backend call (seconds)
+BACKEND_TIMEOUT = float(os.getenv('BACKEND_TIMEOUT', 10))
+
+# Endpoint of the google_web backend (point at mock_upstream.py for load tests)
+GOOGLE_WEB_URL = os.getenv('GOOGLE_WEB_URL', 'https://translate.googleapis.com/translate_a/single')
+
+# Google Cloud Translation v2 request limits: text segments per request,
+# and the recommended total size (characters)
+GOOGLE_CLOUD_MAX_SEGMENTS = 128
+GOOGLE_CLOUD_MAX_CHARS = 30000
+
+# Fallback chain, in order
+DEFAULT_BACKENDS = 'google_web,google_cloud,deep_translator'
+
+# Failure classes, from most to least telling about the input itself:
+# a backend answered without a usable translation, a backend errored, the
+# request's deadline cut a call short, every backend was at its limit
+FAILURES = ('unchanged', 'unavailable', 'deadline', 'saturated')
+_OUTCOME_FAILURES = {'empty': 'unchanged', 'error': 'unavailable',
+                     'deadline': 'deadline', 'saturated': 'saturated'}
+
+
+def merge_failure(failure: Optional[str], outcome: str) -> str:
+    """Combine the failure so far with a backend call's outcome, keeping the most telling"""
+    new = _OUTCOME_FAILURES[outcome]
+    if failure is None or FAILURES.index(new) < FAILURES.index(failure):
+        return new
+    return failure
+
+
+class BackendTimeout(TimeoutError):
+    """A library call overran its timeout and is still running"""
+
+    def __init__(self, timeout: float, future):
+        super().__init__(f"Backend call exceeded {timeout:.1f}s")
+        self.future = future
+
+
+def run_with_timeout(func, timeout: float, pool: ThreadPoolExecutor):
+    """
+    Run a library call that has no timeout option, waiting at most timeout
+
+    The call keeps running in the pool if it overruns, but the caller is
+    released.
+
+    Args:
+        func: Zero-argument callable
+        timeout: Seconds to wait
+        pool: Executor to run the call in
+
+    Returns:
+        The call's return value
+
+    Raises:
+        BackendTimeout: If the call started but did not finish in time
+        TimeoutError: If the call never got a pool thread
+    """
+    future = pool.submit(contextvars.copy_context().run, func)
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        if future.cancel():
+            raise TimeoutError(f"Backend call not started within {timeout:.1f}s")
+        raise BackendTimeout(timeout, future)
+
+
+class TranslationBackend:
+    """
+    Base class for translation backends
+
+    Subclasses set ``name`` and the default limits below and implement
+    ``translate``. Limits can be overridden per backend in .env, e.g.
+    BACKEND_GOOGLE_WEB_CONCURRENCY=4 or BACKEND_DEEP_TRANSLATOR_TIMEOUT=5.
+    """
+
+    name = ''
+    concurrency = 8         # Calls allowed in flight at once
+    timeout = BACKEND_TIMEOUT  # Seconds per call
+    cost = 1.0              # Relative cost per call (used for ordering and stats)
+    supports_batch = False  # Whether translate_batch is a single upstream call
+
+    def __init__(self):
+        """Apply per-backend overrides from the environment"""
+        prefix = f"BACKEND_{self.name.upper()}_"
+        self.concurrency = int(os.getenv(prefix + 'CONCURRENCY', self.concurrency))
+        self.timeout = float(os.getenv(prefix + 'TIMEOUT', self.timeout))
+        self.cost = float(os.getenv(prefix + 'COST', self.cost))
+        # Library calls without a timeout option run here, one thread per
+        # slot, so a hung backend can only tie up its own threads
+        self._pool = ThreadPoolExecutor(max_workers=self.concurrency,
+                                        thread_name_prefix=f"backend-{self.name}")
+
+    def run_with_timeout(self, func, timeout: float):
+        """Run a blocking library call in this backend's pool (see run_with_timeout)"""
+        return run_with_timeout(func, timeout, self._pool)
+
+    def available(self) -> bool:
+        """Whether the backend can be used in this environment"""
+        return True
+
+    def translate(self, text: str, source: str, target: str, timeout: float) -> Optional[str]:
+        """
+        Translate one text
+
+        Args:
+            text: Text to translate
+            source: Source language code
+            target: Target language code
+            timeout: Seconds the call may take
+
+        Returns:
+            Translated text or None
+        """
+        raise NotImplementedError
+
+    def translate_batch(self, texts: List[str], source: str, target: str,
+                        timeout: float) -> List[Optional[str]]:
+        """
+        Translate several texts (one upstream call if supports_batch)
+
+        Returns:
+            Translations in input order, None where a text failed
+        """
+        deadline = Deadline(timeout)
+        results = []
+        for text in texts:
+            try:
+                results.append(self.translate(text, source, target, deadline.timeout()))
+            except DeadlineExceeded:
+                results.append(None)
+        return results
+
+
+class GoogleWebBackend(TranslationBackend):
+    """Unofficial Google Translate web endpoint via requests"""
+
+    name = 'google_web'
+    concurrency = 16
+    cost = 1.0
+
+    def translate(self, text, source, target, timeout):
+        params = {
+            'client': 'gtx',
+            'sl': source,  # source language
+            'tl': target,  # target language
+            'dt': 't',     # data type
+            'q': text
+        }
+
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+
+        response = requests.get(GOOGLE_WEB_URL, params=params, headers=headers, timeout=timeout)
+        response.raise_for_status()
+
+        # Parse the response
+        # Response format: [[[translation_text, original_text, ...], ...], ...]
+        result = response.json()
+
+        if result and isinstance(result, list) and result[0] and isinstance(result[0], list):
+            # Long inputs come back as one segment per sentence
+            segments = [
+                segment[0] for segment in result[0]
+                if isinstance(segment, list) and segment and isinstance(segment[0], str)
+            ]
+            translated_text = ''.join(segments)
+            if translated_text and translated_text != text:
+                return translated_text
+
+        return None
+
+
+class GoogleCloudBackend(TranslationBackend):
+    """Google Cloud Translation (v2 client)"""
+
+    name = 'google_cloud'
+    concurrency = 8
+    cost = 5.0
+    supports_batch = True
+
+    def __init__(self):
+        """Initialize the Google Cloud client if credentials are available"""
+        super().__init__()
+        self.client = None
+
+        if GOOGLE_CLOUD_AVAILABLE:
+            try:
+                credentials_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
+                if credentials_path:
+                    os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
+                self.client = translate_v2.Client()
+            except Exception as e:
+                logger.warning("Google Cloud not initialized, using fallback: %s", e,
+                               extra={'backend': self.name})
+                self.client = None
+
+    def available(self):
+        return self.client is not None
+
+    def translate(self, text, source, target, timeout):
+        return self.translate_batch([text], source, target, timeout)[0]
+
+    def translate_batch(self, texts, source, target, timeout):
+        # Plain text, so quotes and ampersands don't come back as HTML entities
+        deadline = Deadline(timeout)
+        results = []
+        for chunk in self._chunks(texts):
+            remaining = deadline.remaining()
+            if remaining <= 0:
+                raise TimeoutError(f"Backend call exceeded {timeout:.1f}s")
+            results.extend(self.run_with_timeout(lambda chunk=chunk: self.client.translate(
+                chunk,
+                source_language=source,
+                target_language=target,
+                format_='text'
+            ), remaining))
+        return [result.get('translatedText') or None for result in results]
+
+    @staticmethod
+    def _chunks(texts):
+        """Split texts into requests within the API's segment and size limits, in order"""
+        chunk, size = [], 0
+        for text in texts:
+            if chunk and (len(chunk) >= GOOGLE_CLOUD_MAX_SEGMENTS
+                          or size + len(text) > GOOGLE_CLOUD_MAX_CHARS):
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(text)
+            size += len(text)
+        if chunk:
+            yield chunk
+
+
+class DeepTranslatorBackend(TranslationBackend):
+    """deep-translator (Google Translate backend)"""
+
+    name = 'deep_translator'
+    concurrency = 8
+    cost = 1.0
+
+    def available(self):
+        return DEEP_TRANSLATOR_AVAILABLE
+
+    def translate(self, text, source, target, timeout):
+        translator = GoogleTranslator(source=source, target=target)
+        result = self.run_with_timeout(lambda: translator.translate(text), timeout)
+        if result and result != text:
+            return result
+        return None
+
+
+class PlaceholderBackend(TranslationBackend):
+    """
+    Ultra-simple offline fallback when all else fails
+
+    Returns the input wrapped in a marker. Not in the default chain; add it
+    to TRANSLATION_BACKENDS to always return something.
+    """
+
+    name = 'placeholder'
+    concurrency = 1000
+    cost = 0.0
+    supports_batch = True
+
+    def translate(self, text, source, target, timeout):
+        if text:
+            return f"[Kannada translation: {text}]"
+        return None
+
+    def translate_batch(self, texts, source, target, timeout):
+        return [self.translate(text, source, target, timeout) for text in texts]
+
+
+class MockBackend(TranslationBackend):
+    """
+    Offline backend for load tests
+
+    Sleeps MOCK_BACKEND_LATENCY seconds per call, then returns a marked copy
+    of the input, so the app can be driven without touching Google. Calls
+    slower than their timeout behave like a hung library call: the caller
+    gets BackendTimeout and the call holds its slot until it finishes.
+    """
+
+    name = 'mock'
+    concurrency = 1000
+    cost = 0.0
+
+    def __init__(self):
+        super().__init__()
+        self.latency = float(os.getenv('MOCK_BACKEND_LATENCY', 0.05))
+
+    def translate(self, text, source, target, timeout):
+        if self.latency > timeout:
+            return self.run_with_timeout(lambda: self._respond(text, target), timeout)
+        return self._respond(text, target)
+
+    def _respond(self, text, target):
+        time.sleep(self.latency)
+        return f"[{target}] {text}"
+
+
+# Backend name -> class
+BACKENDS: Dict[str, type] = {}
+
+
+def register_backend(cls: type) -> type:
+    """
+    Register a backend class under its name (usable as a class decorator)
+
+    Args:
+        cls: TranslationBackend subclass
+
+    Returns:
+        The class, unchanged
+    """
+    BACKENDS[cls.name] = cls
+    return cls
+
+
+for _cls in (GoogleWebBackend, GoogleCloudBackend, DeepTranslatorBackend,
+             PlaceholderBackend, MockBackend):
+    register_backend(_cls)
+
+
+def create_backends(names: Optional[List[str]] = None) -> List[TranslationBackend]:
+    """
+    Instantiate the configured fallback chain
+
+    Args:
+        names: Backend names in order (default: TRANSLATION_BACKENDS env var).
+            With BACKEND_ORDER=cost the chain is sorted cheapest first.
+
+    Returns:
+        Available backends, in fallback order
+    """
+    if names is None:
+        names = os.getenv('TRANSLATION_BACKENDS', DEFAULT_BACKENDS).split(',')
+
+    backends = []
+    for name in (name.strip() for name in names):
+        if not name:
+            continue
+        if name not in BACKENDS:
+            logger.warning("Unknown translation backend '%s' ignored", name)
+            continue
+        backend = BACKENDS[name]()
+        if backend.available():
+            backends.append(backend)
+
+    if os.getenv('BACKEND_ORDER', 'config').lower() == 'cost':
+        backends.sort(key=lambda backend: backend.cost)
+    return backends
+
+
+class BackendDispatcher:
+    """Runs the fallback chain while enforcing each backend's limits"""
+
+    def __init__(self, backends: List[TranslationBackend]):
+        """
+        Initialize the dispatcher
+
+        Args:
+            backends: Backends in fallback order
+        """
+        self.backends = backends
+        self._slots = {backend.name: threading.BoundedSemaphore(backend.concurrency)
+                       for backend in backends}
+        self._stats_lock = threading.Lock()
+        self._stats = {backend.name: {'calls': 0, 'saturated': 0, 'errors': 0, 'cost': 0.0}
+                       for backend in backends}
+        self._failing = set()  # Backends whose last call raised
+        self._recovery_listeners = []
+
+    def on_recovery(self, callback):
+        """
+        Register a callback run when a failing backend succeeds again
+
+        Args:
+            callback: Called with the backend name
+        """
+        self._recovery_listeners.append(callback)
+
+    def _track_health(self, backend: TranslationBackend, outcome: str):
+        """Record an error, or signal recovery on a failing backend's first success"""
+        with self._stats_lock:
+            if outcome == 'error':
+                self._stats[backend.name]['errors'] += 1
+                self._failing.add(backend.name)
+                return
+            if outcome != 'success' or backend.name not in self._failing:
+                return
+            self._failing.discard(backend.name)
+
+        logger.info("Backend %s recovered", backend.name,
+                    extra={'backend': backend.name, 'outcome': 'recovered'})
+        for callback in self._recovery_listeners:
+            callback(backend.name)
+
+    def _count(self, backend: TranslationBackend, field: str, calls: int = 1):
+        with self._stats_lock:
+            stats = self._stats[backend.name]
+            stats[field] += 1
+            if field == 'calls':
+                stats['cost'] += backend.cost * calls
+
+    def _call(self, backend: TranslationBackend, method: str, payload,
+              source: str, target: str, deadline: Deadline):
+        """
+        Call a backend if it has a free slot and budget remains
+
+        Returns:
+            (result, outcome): the backend's result (None if it is saturated
+            or failed) and 'success', 'empty', 'error', 'deadline' (timed
+            out with a timeout cut short by the deadline; not counted as a
+            backend error) or 'saturated'
+
+        Raises:
+            DeadlineExceeded: If no budget is left
+        """
+        timeout = deadline.timeout(backend.timeout)
+        capped = timeout < backend.timeout
+
+        # Skip (rather than queue behind) a backend already at its limit, so
+        # one slow upstream cannot hold every worker thread
+        slots = self._slots[backend.name]
+        if not slots.acquire(blocking=False):
+            self._count(backend, 'saturated')
+            logger.debug("Backend saturated, skipping", extra={
+                'backend': backend.name, 'outcome': 'saturated'})
+            return None, 'saturated'
+
+        start = time.perf_counter()
+        outcome = 'error'
+        release = True
+        try:
+            self._count(backend, 'calls', len(payload) if method == 'translate_batch' else 1)
+            with timed(f"backend_{backend.name}"):
+                result = getattr(backend, method)(payload, source, target, timeout)
+            outcome = 'success' if result and result != payload else 'empty'
+            return result, outcome
+        except Exception as e:
+            if isinstance(e, BackendTimeout):
+                # The call is still running: keep its slot until it returns,
+                # so hung calls count against the backend's concurrency
+                release = False
+                e.future.add_done_callback(lambda _: slots.release())
+            if capped and isinstance(e, (TimeoutError, requests.Timeout)):
+                # The caller's budget ran out, not the backend's
+                outcome = 'deadline'
+                logger.warning("Backend %s cut short by the deadline", backend.name,
+                               extra={'backend': backend.name, 'outcome': outcome})
+            else:
+                logger.error("Backend %s failed: %s", backend.name, e,
+                             extra={'backend': backend.name, 'outcome': 'error'})
+            return None, outcome
+        finally:
+            if release:
+                slots.release()
+            self._track_health(backend, outcome)
+            logger.debug("Backend call finished", extra={
+                'backend': backend.name,
+                'latency_ms': round((time.perf_counter() - start) * 1000, 1),
+                'outcome': outcome,
+            })
+
+    def translate(self, text: str, source: str, target: str,
+                  deadline: Deadline) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Translate one text with the first backend that succeeds
+
+        Returns:
+            (result, failure): the translation and None, or None and the
+            most telling failure class in FAILURES
+
+        Raises:
+            DeadlineExceeded: If the budget runs out before any backend succeeds
+        """
+        failure = None
+        for backend in self.backends:
+            result, outcome = self._call(backend, 'translate', text, source, target, deadline)
+            if outcome == 'success':
+                return result, None
+            failure = merge_failure(failure, outcome)
+        return None, failure or 'unavailable'
+
+    def translate_batch(self, texts: List[str], source: str, target: str,
+                        deadline: Deadline, max_workers: int = 1
+                        ) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+        """
+        Translate several texts, falling back per text
+
+        Batch-capable backends get all remaining texts in one call; others
+        are called per text, up to max_workers at once.
+
+        Returns:
+            (results, failures): translations in input order (None where
+            every backend failed) and, for each failed text, its most
+            telling failure class in FAILURES
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        failures: List[Optional[str]] = [None] * len(texts)
+        context = contextvars.copy_context()
+
+        for backend in self.backends:
+            pending = [i for i, result in enumerate(results) if result is None]
+            if not pending or deadline.expired():
+                break
+
+            if backend.supports_batch:
+                try:
+                    batch, outcome = self._call(backend, 'translate_batch', [texts[i] for i in pending],
+                                                source, target, deadline)
+                except DeadlineExceeded:
+                    break
+                batch = batch or [None] * len(pending)
+                for i, result in zip(pending, batch):
+                    if result and result != texts[i]:
+                        results[i] = result
+                    else:
+                        failures[i] = merge_failure(failures[i],
+                                                    'empty' if outcome == 'success' else outcome)
+                continue
+
+            def one(i, backend=backend):
+                try:
+                    result, outcome = self._call(backend, 'translate', texts[i], source, target, deadline)
+                except DeadlineExceeded:
+                    return None, 'deadline'
+                if outcome == 'success' and result == texts[i]:
+                    outcome = 'empty'
+                return (result, None) if outcome == 'success' else (None, outcome)
+
+            if max_workers <= 1 or len(pending) <= 1:
+                outcomes = {i: one(i) for i in pending}
+            else:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+                    futures = {i: pool.submit(context.copy().run, one, i) for i in pending}
+                    outcomes = {i: future.result() for i, future in futures.items()}
+            for i, (result, outcome) in outcomes.items():
+                if outcome is None:
+                    results[i] = result
+                else:
+                    failures[i] = merge_failure(failures[i], outcome)
+
+        for i, result in enumerate(results):
+            if result is None:
+                failures[i] = failures[i] or ('deadline' if deadline.expired() else 'unavailable')
+            else:
+                failures[i] = None
+        return results, failures
+
+    def stats(self) -> Dict[str, dict]:
+        """Per-backend call, saturation, error and cost counters"""
+        with self._stats_lock:
+            return {
+                backend.name: {
+                    **self._stats[backend.name],
+                    'healthy': backend.name not in self._failing,
+                    'concurrency': backend.concurrency,
+                    'timeout': backend.timeout,
+                    'unit_cost': backend.cost,
+                    'supports_batch': backend.supports_batch,
+                }
+                for backend in self.backends
+            }
@@ -0,0 +1,123 @@
+"""
+Translation Cache Module
+Thread-safe in-memory LRU cache with per-entry expiry
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class TranslationCache:
+    """LRU cache of translations with a time-to-live"""
+
+    def __init__(self, max_size: int = 10000, ttl: float = 86400, grace: float = 0):
+        """
+        Initialize the cache
+
+        Args:
+            max_size: Maximum number of entries (least recently used are evicted)
+            ttl: Seconds an entry stays valid
+            grace: Seconds an expired entry is kept for lookup() to serve as stale
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.grace = grace
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """
+        Look up a value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self.lookup(key, allow_stale=False)
+        return entry[0] if entry else None
+
+    def lookup(self, key: Any, allow_stale: bool = True) -> Optional[Tuple[Any, bool]]:
+        """
+        Look up a value, including expired ones still within the grace period
+
+        Args:
+            key: Cache key
+            allow_stale: Return expired values that are within the grace period
+
+        Returns:
+            (value, stale), or None if missing or past the grace period
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] + self.grace <= now:
+                del self._entries[key]
+                entry = None
+            if entry is None or (entry[1] <= now and not allow_stale):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            stale = entry[1] <= now
+            if stale:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+            return entry[0], stale
+
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None):
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds this entry stays valid (default: the cache's ttl)
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self, predicate=None) -> int:
+        """
+        Remove every entry, or only those whose value matches predicate
+
+        Args:
+            predicate: Called with each value; entries it returns True for
+                are removed (default: all)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if predicate is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [key for key, (value, _) in self._entries.items() if predicate(value)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Hit/stale/miss counters and current size"""
+        total = self.hits + self.stale_hits + self.misses
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+        }
@@ -4,188 +4,488 @@ Handles text translation using multiple translation engines
 """
 
 import os
-from typing import Optional
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
-import requests
-import json
-
-# Try to use Google Cloud, fallback to deep-translator
-try:
-    from google.cloud import translate_v2
-    GOOGLE_CLOUD_AVAILABLE = True
-except ImportError:
-    GOOGLE_CLOUD_AVAILABLE = False
-
-try:
-    from deep_translator import GoogleTranslator
-    DEEP_TRANSLATOR_AVAILABLE = True
-except ImportError:
-    DEEP_TRANSLATOR_AVAILABLE = False
+
+from structured_logging import get_logger
+from request_timing import timed
+from deadline import Deadline, DeadlineExceeded
+from translation_cache import TranslationCache
+from text_templates import TextTemplate, canonicalize
+from translation_backends import BackendDispatcher, create_backends
+from script_detection import route
 
 load_dotenv()
 
+logger = get_logger('translator')
+
+# Default time budget for one translate() call, across all backends (seconds)
+DEFAULT_DEADLINE = float(os.getenv('TRANSLATE_DEADLINE', 10))
+
+# Default language pair
+SOURCE_LANGUAGE = os.getenv('SOURCE_LANGUAGE', 'en')
+TARGET_LANGUAGE = os.getenv('TARGET_LANGUAGE', 'kn')
+
+# Language codes accepted as source or target
+LANGUAGES = {
+    'en': 'English',
+    'kn': 'Kannada',
+    'hi': 'Hindi',
+    'ta': 'Tamil',
+    'te': 'Telugu',
+    'ml': 'Malayalam',
+    'mr': 'Marathi',
+    'bn': 'Bengali',
+    'gu': 'Gujarati',
+    'pa': 'Punjabi',
+    'or': 'Odia',
+    'as': 'Assamese',
+    'ur': 'Urdu',
+    'sa': 'Sanskrit',
+}
+
+# Classify input by Unicode script before translating: text already in the
+# target script is returned as is, text in another script changes the source
+DETECT_SCRIPT = os.getenv('DETECT_SCRIPT', 'true').lower() == 'true'
+
+# Target languages translated concurrently by translate_multi()
+FANOUT_CONCURRENCY = int(os.getenv('FANOUT_CONCURRENCY', 8))
+
+# Translation cache, keyed by language pair and canonical template text
+CACHE_SIZE = int(os.getenv('TRANSLATION_CACHE_SIZE', 10000))
+CACHE_TTL = float(os.getenv('TRANSLATION_CACHE_TTL', 86400))
+
+# Expired translations are kept this much longer (seconds) and served as
+# stale while a background refresh runs, so upstream outages don't fail
+# known phrases. Refreshes run at most REFRESH_CONCURRENCY at a time; beyond
+# REFRESH_QUEUE pending keys new ones are dropped (retried on a later hit).
+CACHE_GRACE = float(os.getenv('TRANSLATION_CACHE_GRACE', 604800))
+REFRESH_CONCURRENCY = int(os.getenv('REFRESH_CONCURRENCY', 2))
+REFRESH_QUEUE = int(os.getenv('REFRESH_QUEUE', 256))
+
+# Inputs no backend could translate are remembered briefly so repeats fail
+# fast: longer when backends answered without a usable translation, shorter
+# when they were down or timed out. A recovering backend clears the outage
+# entries. Saturated backends (local back-pressure) are never remembered.
+NEGATIVE_CACHE_SIZE = int(os.getenv('NEGATIVE_CACHE_SIZE', 10000))
+NEGATIVE_CACHE_TTL = {
+    'unchanged': float(os.getenv('NEGATIVE_CACHE_TTL', 300)),
+    'unavailable': float(os.getenv('NEGATIVE_CACHE_OUTAGE_TTL', 15)),
+    'deadline': float(os.getenv('NEGATIVE_CACHE_OUTAGE_TTL', 15)),
+}
+
+# Lowercase templates before lookup/translation (raises hit rates on
+# inconsistently cased input at some cost in fidelity)
+TEMPLATE_CASEFOLD = os.getenv('TEMPLATE_CASEFOLD', 'false').lower() == 'true'
+
+# Write numbers from the input with Kannada digits (೧೨೩) in the output
+KANNADA_NUMERALS = os.getenv('KANNADA_NUMERALS', 'false').lower() == 'true'
+
 
 class EnglishKannadaTranslator:
-    """Translator class for English to Kannada translation"""
+    """
+    Translator class for English to Kannada translation
+    
+    Other language pairs can be set per instance or per call.
+    """
     
-    def __init__(self):
-        """Initialize the translator"""
-        self.source_lang = "en"
-        self.target_lang = "kn"
-        self.client = None
+    def __init__(self, source_lang: Optional[str] = None, target_lang: Optional[str] = None):
+        """
+        Initialize the translator
         
-        if GOOGLE_CLOUD_AVAILABLE:
-            try:
-                credentials_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
-                if credentials_path:
-                    os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
-                self.client = translate_v2.Client()
-            except Exception as e:
-                print(f"Warning: Google Cloud not initialized. Using fallback. Error: {e}")
-                self.client = None
+        Args:
+            source_lang: Default source language (default: SOURCE_LANGUAGE)
+            target_lang: Default target language (default: TARGET_LANGUAGE)
+        """
+        self.source_lang = self._check_language(source_lang or SOURCE_LANGUAGE)
+        self.target_lang = self._check_language(target_lang or TARGET_LANGUAGE)
+        self.cache = TranslationCache(max_size=CACHE_SIZE, ttl=CACHE_TTL, grace=CACHE_GRACE)
+        self.failures = TranslationCache(max_size=NEGATIVE_CACHE_SIZE)
+        self.kannada_numerals = KANNADA_NUMERALS
+        
+        # Background refreshes of stale cache entries
+        self._refresh_pool = ThreadPoolExecutor(max_workers=REFRESH_CONCURRENCY,
+                                                thread_name_prefix='cache-refresh')
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        self.refresh_stats = {'scheduled': 0, 'refreshed': 0, 'failed': 0, 'dropped': 0}
+        
+        # Fallback chain from TRANSLATION_BACKENDS, with per-backend limits
+        self.dispatcher = BackendDispatcher(create_backends())
+        self.dispatcher.on_recovery(self._on_backend_recovered)
+    
+    @staticmethod
+    def _check_language(code: str) -> str:
+        code = code.lower()
+        if code not in LANGUAGES:
+            raise ValueError(f"Unsupported language '{code}', expected one of: {', '.join(LANGUAGES)}")
+        return code
+    
+    def _pair(self, source: Optional[str], target: Optional[str]):
+        """Resolve a call's language pair against the instance defaults"""
+        return (self._check_language(source or self.source_lang),
+                self._check_language(target or self.target_lang))
+    
+    def _numerals(self, target: str) -> bool:
+        """Whether numbers are written with Kannada digits for this target"""
+        return self.kannada_numerals and target == 'kn'
     
-    def translate(self, text: str) -> Optional[str]:
+    def translate(self, text: str, deadline: Optional[Deadline] = None,
+                  source: Optional[str] = None, target: Optional[str] = None) -> Optional[str]:
         """
-        Translate English text to Kannada
+        Translate English text to Kannada (or between another language pair)
         
         Args:
             text: English text to translate
+            deadline: Time budget shared by all backends (default: TRANSLATE_DEADLINE)
+            source: Source language code (default: the instance's)
+            target: Target language code (default: the instance's)
             
         Returns:
-            Translated Kannada text or None if translation fails
+            Translated Kannada text or None if translation fails or the
+            deadline passes
+            
+        Raises:
+            ValueError: If a language code is not supported
         """
-        if not text or not text.strip():
-            return ""
+        return self.translate_with_status(text, deadline, source, target)[0]
+    
+    def translate_with_status(self, text: str, deadline: Optional[Deadline] = None,
+                              source: Optional[str] = None,
+                              target: Optional[str] = None) -> Tuple[Optional[str], bool]:
+        """
+        Translate text, also reporting whether the result is stale
         
-        try:
-            # Try Google Translate web API first
-            result = self._translate_with_google_api(text)
-            if result and result != text:
-                return result
-            
-            # Try Google Cloud API
-            if self.client and GOOGLE_CLOUD_AVAILABLE:
-                result = self.client.translate_text(
-                    text,
-                    source_language=self.source_lang,
-                    target_language=self.target_lang
-                )
-                translated = result.get('translatedText', '')
-                if translated and translated != text:
-                    return translated
+        A cached translation past its TTL but within TRANSLATION_CACHE_GRACE
+        is returned right away and refreshed in the background.
+        
+        Args:
+            text: English text to translate
+            deadline: Time budget shared by all backends (default: TRANSLATE_DEADLINE)
+            source: Source language code (default: the instance's)
+            target: Target language code (default: the instance's)
             
-            # Try deep-translator (Google Translate backend)
-            if DEEP_TRANSLATOR_AVAILABLE:
-                result = self._translate_with_deep_translator(text)
-                if result and result != text:
-                    return result
+        Returns:
+            (translated text or None, whether it came from an expired cache entry)
             
+        Raises:
+            ValueError: If a language code is not supported
+        """
+        source, target = self._pair(source, target)
+        if not text or not text.strip():
+            return "", False
+        if source == target:
+            return text, False
+        
+        # Numbers, URLs, emails and code become placeholders, so e.g.
+        # "Order 1042 shipped" and "Order 1043 shipped" share one template
+        template = TextTemplate(text, casefold=TEMPLATE_CASEFOLD)
+        numerals = self._numerals(target)
+        source = self._route(template, source, target)
+        if source is None:
+            return template.render_untranslated(numerals), False
+        
+        key = (source, target, template.text)
+        with timed('cache'):
+            entry = self.cache.lookup(key)
+        if entry is not None:
+            cached, stale = entry
+            if stale:
+                self._schedule_refresh(key, template)
+            return template.fill(cached, numerals), stale
+        
+        failure = self.failures.get(key)
+        if failure is not None:
+            logger.debug("Known untranslatable input, failing fast", extra={'outcome': failure})
+            return None, False
+        
+        deadline = deadline or Deadline(DEFAULT_DEADLINE)
+        translated = self._translate_uncached(template.text, source, target, deadline, key)
+        if not translated:
+            return None, False
+        
+        result = template.fill(translated, numerals)
+        if result is not None:
+            self.cache.set(key, translated)
+            return result, False
+        
+        # The backend mangled a placeholder: translate the text as given
+        logger.debug("Template placeholders lost, translating original text")
+        return self._translate_uncached(canonicalize(text), source, target, deadline), False
+    
+    def _route(self, template: TextTemplate, source: str, target: str) -> Optional[str]:
+        """
+        Source language to translate a template from, decided locally
+        
+        Returns:
+            None if there is nothing to translate (no letters, or the text
+            is already in the target's script), else the source language
+        """
+        if not template.translatable:
             return None
-        except Exception as e:
-            print(f"Translation error: {e}")
-            # Try Google API as fallback
-            try:
-                return self._translate_with_google_api(text)
-            except:
-                pass
-            return None
+        if not DETECT_SCRIPT:
+            return source
+        routed = route(template.text, source, target)
+        if routed is None:
+            logger.debug("Input already in target script, not translating")
+        return routed
     
-    def _translate_with_google_api(self, text: str) -> Optional[str]:
+    def _translate_uncached(self, text: str, source: str, target: str,
+                            deadline: Deadline, key: Optional[tuple] = None) -> Optional[str]:
         """
-        Translate using Google Translate API via requests
-        Uses the unofficial Google Translate API endpoint
+        Run the backend fallback chain
         
         Args:
             text: Text to translate
+            source: Source language code
+            target: Target language code
+            deadline: Time budget shared by all backends
+            key: Cache key under which to remember a failure (None: don't)
             
         Returns:
             Translated text or None
         """
         try:
-            # Google Translate API endpoint
-            url = "https://translate.googleapis.com/translate_a/single"
-            
-            params = {
-                'client': 'gtx',
-                'sl': 'en',  # source language
-                'tl': 'kn',  # target language (Kannada)
-                'dt': 't',   # data type
-                'q': text
-            }
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            # Parse the response
-            # Response format: [[[translation_text, original_text, ...], ...], ...]
-            result = response.json()
-            
-            if result and isinstance(result, list) and len(result) > 0:
-                # Get the translations list
-                if result[0] and isinstance(result[0], list) and len(result[0]) > 0:
-                    translations_list = result[0][0]
-                    
-                    if translations_list and isinstance(translations_list, list) and len(translations_list) > 0:
-                        translated_text = translations_list[0]
-                        
-                        if translated_text and isinstance(translated_text, str) and translated_text != text:
-                            return translated_text
-            
-            return None
-            
+            result, failure = self.dispatcher.translate(text, source, target, deadline)
+            if result:
+                return result
+            logger.warning("All translation backends failed", extra={'outcome': failure})
+        except DeadlineExceeded:
+            failure = 'deadline'
+            logger.warning("Translation deadline exceeded", extra={'outcome': failure})
+        
+        if key is not None:
+            self._remember_failure(key, failure, deadline)
+        return None
+    
+    def _remember_failure(self, key: tuple, failure: str, deadline: Deadline,
+                          full_budget: float = DEFAULT_DEADLINE):
+        """
+        Negative-cache a failure, unless it says nothing about the input
+        
+        Args:
+            key: Cache key
+            failure: Failure class from the dispatcher
+            deadline: Deadline the attempt ran under
+            full_budget: Budget below which a deadline failure is blamed on
+                the client's tight budget rather than the input
+        """
+        if failure not in NEGATIVE_CACHE_TTL:
+            return  # Saturation is local back-pressure
+        if failure == 'deadline' and deadline.budget < full_budget:
+            return
+        self.failures.set(key, failure, NEGATIVE_CACHE_TTL[failure])
+    
+    def _schedule_refresh(self, key: tuple, template: TextTemplate):
+        """
+        Queue a background refresh of a stale cache entry
+        
+        Each key is refreshed once at a time, and not while a recent
+        failure for it is remembered (a recovering backend clears those).
+        """
+        if self.failures.get(key) is not None:
+            return
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            if len(self._refreshing) >= REFRESH_QUEUE:
+                self.refresh_stats['dropped'] += 1
+                return
+            self._refreshing.add(key)
+            self.refresh_stats['scheduled'] += 1
+        # Submitted without the request's context: the refresh outlives the
+        # request, so it must not add to its timers
+        self._refresh_pool.submit(self._refresh, key, template)
+    
+    def _refresh(self, key: tuple, template: TextTemplate):
+        """Re-translate a stale cache entry, keeping the stale value on failure"""
+        source, target, text = key
+        outcome = 'failed'
+        try:
+            translated = self._translate_uncached(text, source, target,
+                                                  Deadline(DEFAULT_DEADLINE), key)
+            if translated and template.fill(translated) is not None:
+                self.cache.set(key, translated)
+                outcome = 'refreshed'
         except Exception as e:
-            print(f"Google Translate API error: {e}")
-            return None
+            logger.warning("Cache refresh failed: %s", e)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+                self.refresh_stats[outcome] += 1
     
-    def _translate_with_deep_translator(self, text: str) -> Optional[str]:
+    def refresh_status(self) -> dict:
+        """Background refresh counters and the number of refreshes pending"""
+        with self._refresh_lock:
+            return {**self.refresh_stats, 'pending': len(self._refreshing)}
+    
+    def _on_backend_recovered(self, backend: str):
+        """Forget outage failures once a failing backend answers again"""
+        cleared = self.failures.clear(lambda failure: failure != 'unchanged')
+        if cleared:
+            logger.info("Cleared %d cached outage failures after %s recovered",
+                        cleared, backend)
+    
+    def translate_batch(self, texts: list, max_workers: int = 1,
+                        deadline: Optional[Deadline] = None,
+                        source: Optional[str] = None, target: Optional[str] = None) -> list:
         """
-        Translate using deep-translator (Google Translate backend)
+        Translate multiple texts
         
         Args:
-            text: Text to translate
+            texts: List of English texts
+            max_workers: Number of texts translated concurrently
+            deadline: Time budget for the whole batch (default: one
+                TRANSLATE_DEADLINE per text sent upstream)
+            source: Source language code (default: the instance's)
+            target: Target language code (default: the instance's)
             
         Returns:
-            Translated text or None
+            List of translated texts, in the same order as the input
         """
-        try:
-            translator = GoogleTranslator(source_language='en', target_language='kn')
-            result = translator.translate(text)
-            if result and result != text:
-                return result
-            return None
-        except Exception as e:
-            print(f"Deep translator error: {e}")
-            return None
+        return self.translate_batch_with_status(texts, max_workers, deadline, source, target)[0]
     
-    def _fallback_simple_translate(self, text: str) -> Optional[str]:
+    def translate_batch_with_status(self, texts: list, max_workers: int = 1,
+                                    deadline: Optional[Deadline] = None,
+                                    source: Optional[str] = None,
+                                    target: Optional[str] = None) -> Tuple[list, list]:
         """
-        Ultra-simple fallback when all else fails
+        Translate multiple texts, also reporting which results are stale
+        
+        Cache hits (stale ones included, which are refreshed in the
+        background) are served directly and repeated templates are sent
+        upstream once; batch-capable backends get the misses in one call.
+        
+        Args:
+            texts: List of English texts
+            max_workers: Number of texts translated concurrently
+            deadline: Time budget for the whole batch (default: one
+                TRANSLATE_DEADLINE per text sent upstream)
+            source: Source language code (default: the instance's)
+            target: Target language code (default: the instance's)
+            
+        Returns:
+            (translated texts, stale flags), both in the same order as the input
+        """
+        source, target = self._pair(source, target)
+        numerals = self._numerals(target)
+        results = [None] * len(texts)
+        stale = [False] * len(texts)
+        pending = {}  # (source, template text) -> [(index, template), ...]
+        
+        with timed('cache'):
+            for i, text in enumerate(texts):
+                if not text or not text.strip():
+                    results[i] = ""
+                    continue
+                template = TextTemplate(text, casefold=TEMPLATE_CASEFOLD)
+                text_source = self._route(template, source, target)
+                if text_source is None:
+                    results[i] = template.render_untranslated(numerals)
+                    continue
+                entry = self.cache.lookup((text_source, target, template.text))
+                if entry is not None:
+                    results[i] = template.fill(entry[0], numerals)
+                    stale[i] = entry[1]
+                    if entry[1]:
+                        self._schedule_refresh((text_source, target, template.text), template)
+                    continue
+                if self.failures.get((text_source, target, template.text)) is not None:
+                    continue
+                pending.setdefault((text_source, template.text), []).append((i, template))
+        
+        if not pending:
+            return results, stale
+        
+        deadline = deadline or Deadline(DEFAULT_DEADLINE * len(pending))
+        by_source = {}
+        for text_source, key in pending:
+            by_source.setdefault(text_source, []).append(key)
+        
+        for text_source, keys in by_source.items():
+            translations, failures = self.dispatcher.translate_batch(keys, text_source, target,
+                                                                     deadline, max_workers)
+            
+            for key, translated, failure in zip(keys, translations, failures):
+                if not translated:
+                    self._remember_failure((text_source, target, key), failure, deadline,
+                                           DEFAULT_DEADLINE * len(pending))
+                    continue
+                for i, template in pending[(text_source, key)]:
+                    result = template.fill(translated, numerals)
+                    if result is None:
+                        # The backend mangled a placeholder: translate the text as given
+                        result = self._translate_uncached(canonicalize(texts[i]), text_source, target, deadline)
+                    else:
+                        self.cache.set((text_source, target, key), translated)
+                    results[i] = result
+        
+        return results, stale
+    
+    def translate_multi(self, text: str, targets: List[str],
+                        deadline: Optional[Deadline] = None,
+                        source: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        Translate one text into several target languages concurrently
         
         Args:
             text: Text to translate
+            targets: Target language codes
+            deadline: Time budget for all targets (default: TRANSLATE_DEADLINE)
+            source: Source language code (default: the instance's)
             
         Returns:
-            Placeholder translation
+            Target code -> translated text (None where it failed), in target order
+            
+        Raises:
+            ValueError: If a language code is not supported
         """
-        if text:
-            return f"[Kannada translation: {text}]"
-        return None
+        results = self.translate_multi_with_status(text, targets, deadline, source)
+        return {target: result for target, (result, _) in results.items()}
     
-    def translate_batch(self, texts: list) -> list:
+    def translate_multi_with_status(self, text: str, targets: List[str],
+                                    deadline: Optional[Deadline] = None,
+                                    source: Optional[str] = None
+                                    ) -> Dict[str, Tuple[Optional[str], bool]]:
         """
-        Translate multiple texts
+        Translate one text into several target languages concurrently,
+        also reporting which results are stale
+        
+        Targets share one deadline, so the call takes about as long as the
+        slowest target rather than the sum of all of them.
         
         Args:
-            texts: List of English texts
+            text: Text to translate
+            targets: Target language codes
+            deadline: Time budget for all targets (default: TRANSLATE_DEADLINE)
+            source: Source language code (default: the instance's)
             
         Returns:
-            List of translated texts
+            Target code -> (translated text or None, stale), in target order
+            
+        Raises:
+            ValueError: If a language code is not supported
         """
-        return [self.translate(text) for text in texts]
+        source = self._check_language(source or self.source_lang)
+        targets = list(dict.fromkeys(self._check_language(target) for target in targets))
+        if not targets:
+            return {}
+        
+        deadline = deadline or Deadline(DEFAULT_DEADLINE)
+        
+        # Run each target in a copy of the caller's context so request ids
+        # and timers follow the work into the pool threads
+        context = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=min(FANOUT_CONCURRENCY, len(targets))) as pool:
+            futures = {
+                target: pool.submit(context.copy().run, self.translate_with_status,
+                                    text, deadline, source, target)
+                for target in targets
+            }
+            return {target: future.result() for target, future in futures.items()}
 
 
 if __name__ == "__main__":
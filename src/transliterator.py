@@ -0,0 +1,237 @@
+"""
+Kannada Transliteration Module
+Offline conversion between Kannada script and romanized Kannada (ISO 15919, ITRANS)
+"""
+
+import re
+import unicodedata
+from typing import Dict, List
+
+
+SCHEMES = ('iso', 'itrans')
+
+# Placeholders used while converting Kannada to Latin: every consonant is
+# emitted with INHERENT, every vowel sign / virama starts with KILL, and an
+# INHERENT directly followed by KILL cancels out. The rest become 'a'.
+_INHERENT = '\ue000'
+_KILL = '\ue001'
+
+VIRAMA = '್'
+
+# (independent vowel, vowel sign, iso, itrans); the vowel sign of 'a' is implicit
+_VOWELS = [
+    ('ಅ', '', 'a', 'a'),
+    ('ಆ', 'ಾ', 'ā', 'A'),
+    ('ಇ', 'ಿ', 'i', 'i'),
+    ('ಈ', 'ೀ', 'ī', 'I'),
+    ('ಉ', 'ು', 'u', 'u'),
+    ('ಊ', 'ೂ', 'ū', 'U'),
+    ('ಋ', 'ೃ', 'r̥', 'RRi'),
+    ('ೠ', 'ೄ', 'r̥̄', 'RRI'),
+    ('ಌ', 'ೢ', 'l̥', 'LLi'),
+    ('ೡ', 'ೣ', 'l̥̄', 'LLI'),
+    ('ಎ', 'ೆ', 'e', 'e'),
+    ('ಏ', 'ೇ', 'ē', 'E'),
+    ('ಐ', 'ೈ', 'ai', 'ai'),
+    ('ಒ', 'ೊ', 'o', 'o'),
+    ('ಓ', 'ೋ', 'ō', 'O'),
+    ('ಔ', 'ೌ', 'au', 'au'),
+]
+
+# (consonant, iso, itrans)
+_CONSONANTS = [
+    ('ಕ', 'k', 'k'), ('ಖ', 'kh', 'kh'), ('ಗ', 'g', 'g'), ('ಘ', 'gh', 'gh'), ('ಙ', 'ṅ', '~N'),
+    ('ಚ', 'c', 'ch'), ('ಛ', 'ch', 'Ch'), ('ಜ', 'j', 'j'), ('ಝ', 'jh', 'jh'), ('ಞ', 'ñ', '~n'),
+    ('ಟ', 'ṭ', 'T'), ('ಠ', 'ṭh', 'Th'), ('ಡ', 'ḍ', 'D'), ('ಢ', 'ḍh', 'Dh'), ('ಣ', 'ṇ', 'N'),
+    ('ತ', 't', 't'), ('ಥ', 'th', 'th'), ('ದ', 'd', 'd'), ('ಧ', 'dh', 'dh'), ('ನ', 'n', 'n'),
+    ('ಪ', 'p', 'p'), ('ಫ', 'ph', 'ph'), ('ಬ', 'b', 'b'), ('ಭ', 'bh', 'bh'), ('ಮ', 'm', 'm'),
+    ('ಯ', 'y', 'y'), ('ರ', 'r', 'r'), ('ಱ', 'ṟ', 'R'), ('ಲ', 'l', 'l'), ('ವ', 'v', 'v'),
+    ('ಶ', 'ś', 'sh'), ('ಷ', 'ṣ', 'Sh'), ('ಸ', 's', 's'), ('ಹ', 'h', 'h'), ('ಳ', 'ḷ', 'L'),
+    ('ೞ', 'ḻ', 'zh'),
+]
+
+# (sign, iso, itrans); only anusvara and visarga are read back from Latin,
+# since '.', '|' and "'" are ordinary punctuation in romanized text
+_OTHERS = [
+    ('ಂ', 'ṁ', 'M'),
+    ('ಃ', 'ḥ', 'H'),
+    ('ಽ', "'", '.a'),
+    ('।', '.', '|'),
+    ('॥', '..', '||'),
+]
+
+_REVERSIBLE_OTHERS = ('ಂ', 'ಃ')
+
+_DIGITS = [(chr(0x0CE6 + i), str(i)) for i in range(10)]
+
+# Extra romanizations accepted when reading Latin text
+_LATIN_ALIASES = {
+    'iso': {'ṃ': 'ಂ'},
+    'itrans': {'aa': 'ಆ', 'ii': 'ಈ', 'uu': 'ಊ', 'w': 'ವ', '.n': 'ಂ'},
+}
+
+
+def _nfc(text: str) -> str:
+    return unicodedata.normalize('NFC', text)
+
+
+def _build_to_latin(column: int) -> Dict[int, str]:
+    """Build the str.translate table for Kannada -> Latin"""
+    table = {}
+    for independent, sign, *latin in _VOWELS:
+        table[ord(independent)] = _nfc(latin[column])
+        if sign:
+            table[ord(sign)] = _KILL + _nfc(latin[column])
+    for consonant, *latin in _CONSONANTS:
+        table[ord(consonant)] = _nfc(latin[column]) + _INHERENT
+    for sign, *latin in _OTHERS:
+        table[ord(sign)] = _nfc(latin[column])
+    for digit, ascii_digit in _DIGITS:
+        table[ord(digit)] = ascii_digit
+    table[ord(VIRAMA)] = _KILL
+    table[ord('಼')] = ''  # nukta
+    return table
+
+
+def _build_to_kannada(column: int, scheme: str):
+    """
+    Build the lookup table and tokenizer for Latin -> Kannada
+
+    Every consonant+vowel syllable is a single token, so one regex pass
+    with dictionary lookups converts the text. The syllable pattern is
+    grouped as consonant, optional vowel, so the engine tries a few dozen
+    alternatives per position rather than every syllable.
+    """
+    independents = {independent for independent, *_ in _VOWELS}
+    aliases = {_nfc(alias): kannada for alias, kannada in _LATIN_ALIASES[scheme].items()}
+
+    vowels = {_nfc(latin[column]): (independent, sign) for independent, sign, *latin in _VOWELS}
+    consonants = {_nfc(latin[column]): consonant for consonant, *latin in _CONSONANTS}
+    others = {_nfc(latin[column]): sign for sign, *latin in _OTHERS if sign in _REVERSIBLE_OTHERS}
+    for alias, kannada in aliases.items():
+        if kannada in independents:
+            vowels[alias] = next((i, s) for i, s, *_ in _VOWELS if i == kannada)
+        elif kannada in consonants.values():
+            consonants[alias] = kannada
+        else:
+            others[alias] = kannada
+
+    table = dict(others)
+    for roman, (independent, sign) in vowels.items():
+        table[roman] = independent
+    for roman, consonant in consonants.items():
+        table[roman] = consonant + VIRAMA
+        for vowel, (independent, sign) in vowels.items():
+            table[roman + vowel] = consonant + sign
+
+    def alternation(keys):
+        return '|'.join(re.escape(key) for key in sorted(keys, key=len, reverse=True))
+
+    # Vowels first, so that e.g. ITRANS 'RRi' is not read as 'R' + 'Ri'
+    pattern = re.compile(
+        f"{alternation(list(vowels) + list(others))}"
+        f"|(?:{alternation(consonants)})(?:{alternation(vowels)})?"
+    )
+    return table, pattern
+
+
+_TO_LATIN = {scheme: _build_to_latin(i) for i, scheme in enumerate(SCHEMES)}
+_TO_KANNADA = {scheme: _build_to_kannada(i, scheme) for i, scheme in enumerate(SCHEMES)}
+
+
+class KannadaTransliterator:
+    """Converts between Kannada script and romanized Kannada"""
+
+    def __init__(self, scheme: str = 'iso'):
+        """
+        Initialize the transliterator
+
+        Args:
+            scheme: Default romanization, 'iso' (ISO 15919) or 'itrans'
+        """
+        self.scheme = self._check_scheme(scheme)
+
+    @staticmethod
+    def _check_scheme(scheme: str) -> str:
+        scheme = scheme.lower()
+        if scheme not in SCHEMES:
+            raise ValueError(f"Unknown scheme '{scheme}', expected one of: {', '.join(SCHEMES)}")
+        return scheme
+
+    def to_latin(self, text: str, scheme: str = None) -> str:
+        """
+        Romanize Kannada text
+
+        Args:
+            text: Text in Kannada script (other characters pass through)
+            scheme: 'iso' or 'itrans' (default: the instance's scheme)
+
+        Returns:
+            Romanized text
+        """
+        scheme = self._check_scheme(scheme or self.scheme)
+        result = text.translate(_TO_LATIN[scheme])
+        return (result.replace(_INHERENT + _KILL, '')
+                      .replace(_INHERENT, 'a')
+                      .replace(_KILL, ''))
+
+    def to_kannada(self, text: str, scheme: str = None) -> str:
+        """
+        Convert romanized (phonetically typed) Kannada to Kannada script
+
+        Args:
+            text: Romanized text (unknown characters pass through)
+            scheme: 'iso' or 'itrans' (default: the instance's scheme)
+
+        Returns:
+            Text in Kannada script
+        """
+        scheme = self._check_scheme(scheme or self.scheme)
+        table, pattern = _TO_KANNADA[scheme]
+        return pattern.sub(lambda match: table[match.group()], _nfc(text))
+
+    def transliterate(self, text: str, direction: str = 'to_latin', scheme: str = None) -> str:
+        """
+        Transliterate in either direction
+
+        Args:
+            text: Input text
+            direction: 'to_latin' or 'to_kannada'
+            scheme: 'iso' or 'itrans' (default: the instance's scheme)
+
+        Returns:
+            Transliterated text
+        """
+        if direction == 'to_latin':
+            return self.to_latin(text, scheme)
+        if direction == 'to_kannada':
+            return self.to_kannada(text, scheme)
+        raise ValueError("Direction must be 'to_latin' or 'to_kannada'")
+
+    def transliterate_batch(self, texts: List[str], direction: str = 'to_latin',
+                            scheme: str = None) -> List[str]:
+        """
+        Transliterate multiple texts
+
+        Args:
+            texts: Input texts
+            direction: 'to_latin' or 'to_kannada'
+            scheme: 'iso' or 'itrans' (default: the instance's scheme)
+
+        Returns:
+            Transliterated texts, in input order
+        """
+        return [self.transliterate(text, direction, scheme) for text in texts]
+
+
+if __name__ == "__main__":
+    # Test the transliterator
+    transliterator = KannadaTransliterator()
+
+    samples = ["ನಮಸ್ಕಾರ, ನೀವು ಹೇಗಿದ್ದೀರಿ?", "ಕನ್ನಡ", "ಬೆಂಗಳೂರು ೨೦೨೬"]
+    for sample in samples:
+        print(f"KN:     {sample}")
+        print(f"ISO:    {transliterator.to_latin(sample, 'iso')}")
+        print(f"ITRANS: {transliterator.to_latin(sample, 'itrans')}")
+        print(f"Back:   {transliterator.to_kannada(transliterator.to_latin(sample, 'itrans'), 'itrans')}")
+        print("-" * 50)
@@ -7,6 +7,10 @@ import os
 import pyttsx3
 from typing import Optional
 
+from structured_logging import get_logger
+
+logger = get_logger('tts')
+
 
 class TTSEngine:
     """Text-to-Speech Engine"""
@@ -26,7 +30,7 @@ class TTSEngine:
             self.voices = self.engine.getProperty('voices')
             self.set_voice_language('english')
         except Exception as e:
-            print(f"Warning: TTS Engine initialization failed: {e}")
+            logger.warning("TTS Engine initialization failed: %s", e)
             self.is_headless = True
     
     def _has_audio_hardware(self):
@@ -87,7 +91,7 @@ class TTSEngine:
             self.engine.say(text)
             self.engine.runAndWait()
         except Exception as e:
-            print(f"TTS error: {e}")
+            logger.error("TTS error: %s", e, extra={'outcome': 'error'})
     
     def save_to_file(self, text: str, filename: str, language: str = 'english'):
         """
@@ -105,10 +109,10 @@ class TTSEngine:
             self.set_voice_language(language)
             self.engine.save_to_file(text, filename)
             self.engine.runAndWait()
-            print(f"Audio saved to: {filename}")
+            logger.info("Audio saved to: %s", filename)
             return True
         except Exception as e:
-            print(f"Error saving to file: {e}")
+            logger.error("Error saving to file: %s", e, extra={'outcome': 'error'})
             return False
     
     def set_speech_rate(self, rate: int):
@@ -10,19 +10,30 @@ class TranslatorAPI {
 
     /**
      * Make a fetch request with timeout
+     * Pass options.signal to let the caller abort the request
      */
     async request(endpoint, options = {}) {
         const controller = new AbortController();
         const timeoutId = setTimeout(() => controller.abort(), this.timeout);
+        const { signal, ...fetchOptions } = options;
+        const abortFromCaller = () => controller.abort();
+
+        if (signal) {
+            if (signal.aborted) {
+                controller.abort();
+            } else {
+                signal.addEventListener('abort', abortFromCaller);
+            }
+        }
 
         try {
             const url = `${this.baseURL}${endpoint}`;
             const response = await fetch(url, {
-                ...options,
+                ...fetchOptions,
                 signal: controller.signal,
                 headers: {
                     'Content-Type': 'application/json',
-                    ...options.headers
+                    ...fetchOptions.headers
                 }
             });
 
@@ -34,21 +45,41 @@ class TranslatorAPI {
             return await response.json();
         } catch (error) {
             if (error.name === 'AbortError') {
+                // Superseded by the caller: let it tell this apart from a timeout
+                if (signal && signal.aborted) {
+                    throw error;
+                }
                 throw new Error('Request timeout');
             }
             throw error;
         } finally {
             clearTimeout(timeoutId);
+            if (signal) {
+                signal.removeEventListener('abort', abortFromCaller);
+            }
         }
     }
 
     /**
      * Translate text from English to Kannada
      */
-    async translate(text) {
+    async translate(text, { signal } = {}) {
         return this.request('/api/translate', {
             method: 'POST',
-            body: JSON.stringify({ text })
+            body: JSON.stringify({ text }),
+            signal
+        });
+    }
+
+    /**
+     * Translate a revision of a longer text; only sentences changed since the
+     * previous call with the same documentId are translated again
+     */
+    async translateIncremental(text, documentId, { signal } = {}) {
+        return this.request('/api/translate-incremental', {
+            method: 'POST',
+            body: JSON.stringify({ text, document_id: documentId }),
+            signal
         });
     }
 
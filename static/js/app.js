@@ -8,6 +8,11 @@ class TranslatorApp {
         this.initEventListeners();
         this.initSpeechRecognition();
         this.translationHistory = [];
+        this.pendingController = null;
+        this.liveTimer = null;
+        this.liveDelay = 400; // ms of typing pause before a live translation
+        // Server-side id of this tab's text, so edits re-translate only changed sentences
+        this.documentId = sessionStorage.getItem('documentId');
     }
 
     /**
@@ -28,6 +33,7 @@ class TranslatorApp {
             copyKannada: document.getElementById('copyKannada'),
             englishCount: document.getElementById('englishCount'),
             kannadaCount: document.getElementById('kannadaCount'),
+            liveTranslate: document.getElementById('liveTranslate'),
             translationHistory: document.getElementById('translationHistory')
         };
     }
@@ -44,6 +50,14 @@ class TranslatorApp {
         this.elements.clearEnglish.addEventListener('click', () => this.clearText('english'));
         this.elements.copyEnglish.addEventListener('click', () => this.copyToClipboard(this.elements.englishText.value, 'English'));
         this.elements.englishText.addEventListener('input', () => this.updateCharCount('english'));
+        this.elements.englishText.addEventListener('input', () => this.scheduleLiveTranslate());
+
+        // Live translate toggle (remembered across visits)
+        this.elements.liveTranslate.checked = localStorage.getItem('liveTranslate') === 'true';
+        this.elements.liveTranslate.addEventListener('change', () => {
+            localStorage.setItem('liveTranslate', this.elements.liveTranslate.checked);
+            this.scheduleLiveTranslate();
+        });
 
         // Kannada panel
         this.elements.speakKannada.addEventListener('click', () => this.speak(this.elements.kannadaText.value, 'kannada'));
@@ -103,33 +117,88 @@ class TranslatorApp {
 
     /**
      * Translate English text to Kannada
+     * Live translations skip history and success messages
      */
-    async translate() {
+    async translate({ live = false } = {}) {
         const text = this.elements.englishText.value.trim();
 
         if (!text) {
-            this.showStatus('Please enter English text to translate', 'error');
+            if (!live) {
+                this.showStatus('Please enter English text to translate', 'error');
+            }
             return;
         }
 
+        // Abort any request this one supersedes
+        if (this.pendingController) {
+            this.pendingController.abort();
+        }
+        const controller = new AbortController();
+        this.pendingController = controller;
+
         try {
+            const cached = await translationCache.get(text);
+            if (controller.signal.aborted) {
+                return;
+            }
+
+            if (cached) {
+                this.showTranslation(text, cached, live);
+                return;
+            }
+
             this.setLoadingState(true);
-            const result = await api.translate(text);
+            const result = await api.translateIncremental(text, this.documentId, { signal: controller.signal });
 
             if (result.success) {
-                this.elements.kannadaText.value = result.kannada;
-                this.updateCharCount('kannada');
-                this.showStatus('Translation successful!', 'success');
-                
-                // Add to history
-                this.addToHistory(result.english, result.kannada);
-            } else {
+                this.documentId = result.document_id;
+                sessionStorage.setItem('documentId', this.documentId);
+                // Stale results are being refreshed on the server; don't keep them
+                if (!result.stale) {
+                    translationCache.set(text, result.kannada);
+                }
+                this.showTranslation(result.english, result.kannada, live, result.stale);
+            } else if (!live) {
                 this.showStatus('Translation failed', 'error');
             }
         } catch (error) {
+            if (error.name === 'AbortError') {
+                return;
+            }
             this.showStatus(`Error: ${error.message}`, 'error');
         } finally {
-            this.setLoadingState(false);
+            if (this.pendingController === controller) {
+                this.pendingController = null;
+                this.setLoadingState(false);
+            }
+        }
+    }
+
+    /**
+     * Debounce live translation while the user is typing
+     */
+    scheduleLiveTranslate() {
+        clearTimeout(this.liveTimer);
+        if (!this.elements.liveTranslate.checked) {
+            return;
+        }
+        this.liveTimer = setTimeout(() => this.translate({ live: true }), this.liveDelay);
+    }
+
+    /**
+     * Display a translation result
+     */
+    showTranslation(english, kannada, live = false, stale = false) {
+        this.elements.kannadaText.value = kannada;
+        this.updateCharCount('kannada');
+
+        if (stale) {
+            this.showStatus('Showing a saved translation; it may be out of date', 'info');
+        } else if (!live) {
+            this.showStatus('Translation successful!', 'success');
+        }
+        if (!live) {
+            this.addToHistory(english, kannada);
         }
     }
 
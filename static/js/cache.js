@@ -0,0 +1,154 @@
+/**
+ * Cache Module - Persistent client-side translation cache (IndexedDB)
+ */
+
+class TranslationCache {
+    /**
+     * Entries are kept for maxAge (matching the server's translation cache
+     * TTL) so fixed or refreshed translations reach the browser; `stored`
+     * records when an entry was written and `timestamp` when it was last
+     * used, which pruning evicts by (least recently used first)
+     */
+    constructor(dbName = 'translator-cache', maxEntries = 500, maxAge = 24 * 60 * 60 * 1000) {
+        this.dbName = dbName;
+        this.storeName = 'translations';
+        this.maxEntries = maxEntries;
+        this.maxAge = maxAge;
+        this.memory = new Map();
+        this.dbPromise = this.openDatabase();
+    }
+
+    /**
+     * Open the IndexedDB database (resolves to null if unavailable)
+     */
+    openDatabase() {
+        if (!window.indexedDB) {
+            return Promise.resolve(null);
+        }
+
+        return new Promise((resolve) => {
+            const request = indexedDB.open(this.dbName, 1);
+
+            request.onupgradeneeded = () => {
+                const store = request.result.createObjectStore(this.storeName, { keyPath: 'key' });
+                store.createIndex('timestamp', 'timestamp');
+            };
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => resolve(null);
+            request.onblocked = () => resolve(null);
+        });
+    }
+
+    /**
+     * Normalize text into a cache key (line breaks are kept, as on the server)
+     */
+    static normalize(text) {
+        return text.normalize('NFC')
+            .replace(/\r\n?/g, '\n')
+            .replace(/[^\S\n]+/g, ' ')
+            .replace(/ +\n/g, '\n')
+            .trim();
+    }
+
+    /**
+     * Whether an entry written at `stored` is still fresh
+     */
+    isFresh(stored) {
+        // Entries from before `stored` was recorded have no age: treat as expired
+        return Date.now() - stored <= this.maxAge;
+    }
+
+    /**
+     * Look up a translation (memory first, then IndexedDB)
+     */
+    async get(text) {
+        const key = TranslationCache.normalize(text);
+        const cached = this.memory.get(key);
+        if (cached && this.isFresh(cached.stored)) {
+            this.remember(key, cached.value, cached.stored);
+            return cached.value;
+        }
+        this.memory.delete(key);
+
+        const db = await this.dbPromise;
+        if (!db) {
+            return null;
+        }
+
+        return new Promise((resolve) => {
+            const store = db.transaction(this.storeName, 'readwrite').objectStore(this.storeName);
+            const request = store.get(key);
+            request.onsuccess = () => {
+                const entry = request.result;
+                if (!entry) {
+                    resolve(null);
+                } else if (!this.isFresh(entry.stored)) {
+                    store.delete(key);
+                    resolve(null);
+                } else {
+                    // Mark as recently used so pruning keeps it
+                    store.put({ ...entry, timestamp: Date.now() });
+                    this.remember(key, entry.value, entry.stored);
+                    resolve(entry.value);
+                }
+            };
+            request.onerror = () => resolve(null);
+        });
+    }
+
+    /**
+     * Store a translation
+     */
+    async set(text, value) {
+        const key = TranslationCache.normalize(text);
+        const now = Date.now();
+        this.remember(key, value, now);
+
+        const db = await this.dbPromise;
+        if (!db) {
+            return;
+        }
+
+        const transaction = db.transaction(this.storeName, 'readwrite');
+        transaction.objectStore(this.storeName).put({ key, value, stored: now, timestamp: now });
+        transaction.oncomplete = () => this.prune(db);
+    }
+
+    /**
+     * Keep the in-memory layer bounded (least recently used evicted first)
+     */
+    remember(key, value, stored) {
+        this.memory.delete(key);
+        this.memory.set(key, { value, stored });
+        if (this.memory.size > this.maxEntries) {
+            this.memory.delete(this.memory.keys().next().value);
+        }
+    }
+
+    /**
+     * Drop the least recently used persisted entries beyond maxEntries
+     */
+    prune(db) {
+        const store = db.transaction(this.storeName, 'readwrite').objectStore(this.storeName);
+        const countRequest = store.count();
+
+        countRequest.onsuccess = () => {
+            let excess = countRequest.result - this.maxEntries;
+            if (excess <= 0) {
+                return;
+            }
+
+            store.index('timestamp').openCursor().onsuccess = (event) => {
+                const cursor = event.target.result;
+                if (cursor && excess > 0) {
+                    cursor.delete();
+                    excess--;
+                    cursor.continue();
+                }
+            };
+        };
+    }
+}
+
+// Create global cache instance
+const translationCache = new TranslationCache();